@@ -36,7 +36,11 @@ def __getattr__(name: str) -> object:
     if name in _lazy_map:
         import importlib
         module = importlib.import_module(_lazy_map[name])
-        return getattr(module, name)
+        obj = getattr(module, name)
+        # Bind on the module so later accesses hit the module dict directly
+        # instead of re-entering __getattr__ (standard PEP 562 pattern)
+        globals()[name] = obj
+        return obj
     raise AttributeError(f"module 'intentgraph' has no attribute {name!r}")
 
 
@@ -1,6 +1,5 @@
 """Output formatting and validation."""
 
-import json
 import logging
 from pathlib import Path
 from types import MappingProxyType
@@ -23,7 +22,8 @@ class OutputFormatter:
 
         if schema_path and schema_path.exists():
             try:
-                self._schema = json.loads(schema_path.read_text())
+                # Read raw bytes in one syscall and decode with orjson
+                self._schema = orjson.loads(schema_path.read_bytes())
             except Exception as e:
                 logger.warning(f"Failed to load schema from {schema_path}: {e}")
 
@@ -33,17 +33,20 @@ class OutputFormatter:
             # Validate with pydantic
             result_dict = result.dict()
 
-            # Convert paths and UUIDs to strings
-            converted_dict = self._convert_types(result_dict)
-
-            # Format with orjson
+            # Serialize directly with orjson, which handles UUIDs and
+            # datetimes natively and falls back to str() for Path and
+            # other types - no Python-level copy of the whole tree
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
             if pretty:
-                return orjson.dumps(
-                    converted_dict,
-                    option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
-                ).decode('utf-8')
-            else:
-                return orjson.dumps(converted_dict).decode('utf-8')
+                options |= orjson.OPT_INDENT_2
+
+            try:
+                return orjson.dumps(result_dict, option=options, default=str).decode('utf-8')
+            except TypeError:
+                # Unusual payloads (e.g. mocks in tests, circular refs) go
+                # through the defensive recursive conversion instead
+                converted_dict = self._convert_types(result_dict)
+                return orjson.dumps(converted_dict, option=options, default=str).decode('utf-8')
 
         except Exception as e:
             logger.error(f"Failed to format JSON output: {e}")
@@ -79,13 +82,13 @@ class OutputFormatter:
             finally:
                 seen.remove(obj_id)
         else:
-            # Handle any other complex types by converting to string
-            try:
-                # Test if it's JSON serializable
-                json.dumps(obj)
+            # JSON-native scalars pass through; anything else becomes a
+            # string. A type check is enough here - round-tripping the
+            # value through json.dumps just to probe serializability did
+            # the full encoding work only to throw it away.
+            if obj is None or isinstance(obj, (bool, int, float, str)):
                 return obj
-            except (TypeError, ValueError):
-                return str(obj)
+            return str(obj)
 
     def validate_against_schema(self, result: AnalysisResult) -> bool:
         """Validate result against JSON schema."""
@@ -1,5 +1,9 @@
 """Language parsers for dependency extraction."""
 
+import functools
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from ...domain.models import Language
@@ -14,6 +18,7 @@ class _ParserRegistry:
     def __init__(self):
         # Lazy initialization: parsers are created on first access
         self._parsers = {}
+        self._lock = threading.Lock()
         self._parser_factories = {
             Language.PYTHON: PythonParser,
             Language.JAVASCRIPT: JavaScriptParser,
@@ -35,13 +40,65 @@ class _ParserRegistry:
                 return None
         return self._parsers.get(language)
 
+    def warm_up(self, languages: Iterable[Language] | None = None) -> None:
+        """Initialize parsers for the given languages concurrently.
+
+        Parser construction loads tree-sitter native libraries, which is
+        I/O-heavy and releases the GIL, so warming several parsers on a
+        thread pool takes roughly the time of the slowest one instead of
+        their sum.
+        """
+        if languages is None:
+            languages = self._parser_factories.keys()
+        pending = [
+            lang for lang in languages
+            if lang in self._parser_factories and lang not in self._parsers
+        ]
+        if not pending:
+            return
+
+        def _init(language: Language) -> None:
+            try:
+                parser = self._parser_factories[language]()
+            except Exception as e:
+                # Log but don't fail if a parser can't be initialized
+                # (e.g., tree-sitter native libraries blocked by security policy)
+                import logging
+                logger = logging.getLogger(__name__)
+                logger.warning(f"Failed to initialize {language.value} parser: {e}")
+                return
+            with self._lock:
+                self._parsers.setdefault(language, parser)
+
+        with ThreadPoolExecutor(max_workers=min(4, len(pending))) as executor:
+            for future in [executor.submit(_init, lang) for lang in pending]:
+                future.result()
+
 _registry = _ParserRegistry()
 
+@functools.cache
 def get_parser_for_language(language: Language) -> LanguageParser | None:
-    """Get appropriate parser for a language."""
+    """Get appropriate parser for a language.
+
+    Memoized: this is called once per analyzed file, and the cache turns
+    the registry lookup into a single C-level probe. Bounded because
+    Language is a small enum. Use reset_parser_cache() when a parser
+    needs to be re-initialized (e.g. after a failed init in tests).
+    """
     return _registry.get_parser(language)
 
 
+def reset_parser_cache() -> None:
+    """Clear memoized parsers so the next lookup re-initializes them."""
+    get_parser_for_language.cache_clear()
+    _registry._parsers.clear()
+
+
+def warm_up_parsers(languages: Iterable[Language] | None = None) -> None:
+    """Eagerly initialize parsers for the given languages (all when None)."""
+    _registry.warm_up(languages)
+
+
 __all__ = [
     "GoParser",
     "JavaScriptParser",
@@ -49,4 +106,6 @@ __all__ = [
     "PythonParser",
     "TypeScriptParser",
     "get_parser_for_language",
+    "reset_parser_cache",
+    "warm_up_parsers",
 ]
@@ -1,105 +1,115 @@
 """Go dependency parser using go list command."""
 
-import json
 import logging
 import os
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
 
+import orjson
+
 from .base import LanguageParser
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class _PkgRec:
+    """Compact projection of one go list package record.
+
+    Keeps only the fields the parser consumes; a slotted struct takes a
+    fraction of the memory of the raw JSON dict and turns field access
+    into a fixed-offset fetch instead of a hash lookup.
+    """
+
+    dir: str
+    import_path: str
+    go_files: tuple[str, ...]
+    imports: tuple[str, ...]
+
+    @classmethod
+    def from_json(cls, pkg_info: dict) -> "_PkgRec":
+        return cls(
+            dir=pkg_info.get('Dir', ''),
+            import_path=pkg_info.get('ImportPath', ''),
+            go_files=tuple(pkg_info.get('GoFiles', ())),
+            imports=tuple(pkg_info.get('Imports', ())),
+        )
+
+
 class GoParser(LanguageParser):
     """Parser for Go files using go list command with caching."""
 
     def __init__(self):
         self.go_list_cache = {}
         self.package_cache = {}
+        # Per-repo lookup indexes built once after `go list` completes:
+        # (file path -> package, import path -> package)
+        self._file_index_cache: dict[str, tuple[dict, dict]] = {}
+        # Memoized validation results, keyed by the caller-supplied path
+        self._resolved_repo: dict[Path, Path] = {}
 
     def extract_dependencies(self, file_path: Path, repo_path: Path) -> list[str]:
         """Extract Go dependencies using go list."""
         dependencies = []
 
         try:
-            # Validate and resolve repo_path
-            validated_repo_path = self._validate_repo_path(repo_path)
+            # Validate and resolve repo_path (memoized - validation stats the
+            # filesystem, and every file in the repo goes through this path)
+            validated_repo_path = self._resolved_repo.get(repo_path)
+            if validated_repo_path is None:
+                validated_repo_path = self._validate_repo_path(repo_path)
+                self._resolved_repo[repo_path] = validated_repo_path
 
             # Check cache first
             cache_key = str(validated_repo_path)
             if cache_key not in self.go_list_cache:
-                # Run go list to get package information with sanitized environment
-                sanitized_env = self._sanitize_environment()
-                result = subprocess.run(
-                    ['go', 'list', '-json', './...'],
-                    check=False, cwd=validated_repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    env=sanitized_env,
-                )
-
-                if result.returncode != 0:
-                    logger.warning(f"go list failed: {result.stderr}")
+                packages = self._run_go_list(validated_repo_path)
+                if packages is None:
                     return []
 
-                # Parse JSON output and cache
-                packages = []
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        try:
-                            pkg_info = json.loads(line)
-                            packages.append(pkg_info)
-                        except json.JSONDecodeError:
-                            continue
-                
                 self.go_list_cache[cache_key] = packages
+                self._file_index_cache[cache_key] = self._build_package_indexes(packages)
             else:
                 packages = self.go_list_cache[cache_key]
 
-            # Find the package containing our file
-            relative_path = file_path.relative_to(repo_path)
-            file_package = None
+            file_to_pkg, importpath_to_pkg = self._file_index_cache[cache_key]
 
-            for pkg in packages:
-                if 'GoFiles' in pkg:
-                    pkg_dir = Path(pkg.get('Dir', ''))
-                    for go_file in pkg['GoFiles']:
-                        if pkg_dir / go_file == file_path:
-                            file_package = pkg
-                            break
-                    if file_package:
-                        break
+            # Find the package containing our file; only fall back to the
+            # syscall-heavy resolve() when the cheap normalized form misses
+            abs_file = file_path if file_path.is_absolute() else validated_repo_path / file_path
+            file_package = (
+                file_to_pkg.get(os.path.normpath(str(abs_file)))
+                or file_to_pkg.get(str(abs_file.resolve()))
+            )
 
             if not file_package:
                 return []
 
-            # Get imports for this package
-            imports = file_package.get('Imports', [])
-
-            # Filter for local imports (within the repository)
-            module_path = file_package.get('Module', {}).get('Path', '')
-
-            for imp in imports:
-                if imp.startswith(module_path):
-                    # This is a local import
-                    # Find the corresponding package
-                    for pkg in packages:
-                        if pkg.get('ImportPath') == imp:
-                            pkg_dir = Path(pkg.get('Dir', ''))
-                            go_files = pkg.get('GoFiles', [])
-
-                            # Add all Go files in the package
-                            for go_file in go_files:
-                                dep_path = pkg_dir / go_file
-                                if dep_path.exists():
-                                    try:
-                                        rel_path = dep_path.relative_to(repo_path)
-                                        dependencies.append(str(rel_path))
-                                    except ValueError:
-                                        pass
-                            break
+            # Bind the index probe and result append as locals so the
+            # per-import loop runs without repeated attribute lookups
+            lookup_pkg = importpath_to_pkg.get
+            add_dependency = dependencies.append
+
+            for imp in file_package.imports:
+                # The index holds exactly the packages go list found in
+                # this repository, so membership doubles as the
+                # local-import filter - one O(1) probe per import
+                target_pkg = lookup_pkg(imp)
+                if target_pkg is None:
+                    continue
+
+                pkg_dir = Path(target_pkg.dir)
+
+                # Add all Go files in the package
+                for go_file in target_pkg.go_files:
+                    dep_path = pkg_dir / go_file
+                    if dep_path.exists():
+                        try:
+                            rel_path = dep_path.relative_to(repo_path)
+                            add_dependency(str(rel_path))
+                        except ValueError:
+                            pass
 
         except subprocess.TimeoutExpired:
             logger.warning("go list command timed out")
@@ -108,6 +118,112 @@ class GoParser(LanguageParser):
 
         return dependencies
 
+    def prime_caches(self, module_roots: list[Path]) -> None:
+        """Pre-fill the go list caches for several module roots at once.
+
+        Each root gets its own `go list -json ./...` invocation run from
+        that root: in module mode the toolchain rejects patterns outside
+        the current main module, so one combined multi-root pattern would
+        fail outright whenever the roots belong to different modules.
+        Priming still front-loads all subprocess work so the per-file
+        analysis path only ever hits warm caches, and a root that hangs
+        or fails does not abort the remaining roots.
+        """
+        for root in module_roots:
+            try:
+                validated = self._resolved_repo.get(root) or self._validate_repo_path(root)
+            except ValueError as e:
+                logger.warning(f"Skipping Go module root {root}: {e}")
+                continue
+            self._resolved_repo[root] = validated
+
+            cache_key = str(validated)
+            if cache_key in self.go_list_cache:
+                continue
+            try:
+                packages = self._run_go_list(validated)
+            except subprocess.TimeoutExpired:
+                logger.warning(f"go list timed out for module root {validated}")
+                continue
+            if packages is None:
+                continue
+            self.go_list_cache[cache_key] = packages
+            self._file_index_cache[cache_key] = self._build_package_indexes(packages)
+
+    def _run_go_list(self, validated_repo_path: Path) -> list[_PkgRec] | None:
+        """Run `go list -json ./...` and decode its output object by object.
+
+        communicate() drains stdout and stderr concurrently under a single
+        30-second deadline, so a hung `go list` cannot block analysis
+        forever and a stderr-heavy run cannot deadlock on a full pipe.
+        The stdout bytes are then split on go list's pretty-printed
+        closing-brace lines and decoded one top-level JSON object at a
+        time with orjson, skipping both the stdlib decoder and a
+        full-stream UTF-8 decode. Returns None when `go list` fails.
+        """
+        sanitized_env = self._sanitize_environment()
+        proc = subprocess.Popen(
+            ['go', 'list', '-json', './...'],
+            cwd=validated_repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=sanitized_env,
+        )
+        try:
+            stdout, stderr = proc.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+
+        if proc.returncode != 0:
+            logger.warning(
+                f"go list failed: {stderr.decode('utf-8', errors='replace')}"
+            )
+            return None
+
+        packages: list[_PkgRec] = []
+        # go list pretty-prints each package, so a top-level object always
+        # ends with a closing brace on its own line. Scan with a moving
+        # offset instead of re-slicing the buffer for every object.
+        start = 0
+        while (end := stdout.find(b'\n}\n', start)) != -1:
+            obj_bytes = stdout[start:end + 2]
+            start = end + 3
+            try:
+                packages.append(_PkgRec.from_json(orjson.loads(obj_bytes)))
+            except orjson.JSONDecodeError:
+                continue
+        remainder = stdout[start:].strip()
+        if remainder:
+            try:
+                packages.append(_PkgRec.from_json(orjson.loads(remainder)))
+            except orjson.JSONDecodeError:
+                pass
+
+        return packages
+
+    def _build_package_indexes(self, packages: list[_PkgRec]) -> tuple[dict, dict]:
+        """Build O(1) lookup indexes over `go list` output.
+
+        Returns a tuple of (go file path -> package, import path -> package)
+        so per-file lookups avoid rescanning the full package list. File
+        keys are normpath-normalized strings: string equality is much
+        cheaper than Path.__eq__, and normalization makes lookups immune
+        to absolute/relative skew between go list output and caller paths.
+        """
+        file_to_pkg: dict[str, _PkgRec] = {}
+        importpath_to_pkg: dict[str, _PkgRec] = {}
+
+        for pkg in packages:
+            pkg_dir = pkg.dir
+            for go_file in pkg.go_files:
+                file_to_pkg[os.path.normpath(os.path.join(pkg_dir, go_file))] = pkg
+            if pkg.import_path:
+                importpath_to_pkg[pkg.import_path] = pkg
+
+        return file_to_pkg, importpath_to_pkg
+
     def _validate_repo_path(self, repo_path: Path) -> Path:
         """Validate and resolve repository path."""
         # Resolve to absolute path to prevent traversal
@@ -119,13 +235,27 @@ class GoParser(LanguageParser):
 
         # Ensure it contains a Go module (go.mod file)
         if not (resolved_path / "go.mod").exists():
-            # Look for any .go files to confirm it's a Go project
-            go_files = list(resolved_path.rglob("*.go"))
-            if not go_files:
+            # Look for any .go file to confirm it's a Go project
+            if not self._has_go_files(resolved_path):
                 raise ValueError(f"No Go files found in repository: {resolved_path}")
 
         return resolved_path
 
+    _SKIP_DIRS = frozenset({'.git', 'node_modules', 'vendor', '__pycache__', '.intentgraph'})
+
+    def _has_go_files(self, resolved_path: Path) -> bool:
+        """Check whether at least one .go file exists under the path.
+
+        Walks with os.walk and stops at the first match instead of
+        materializing every .go path in the tree, so the cost is bounded
+        by the shallowest .go file rather than the full traversal.
+        """
+        for _root, dirs, files in os.walk(resolved_path):
+            dirs[:] = [d for d in dirs if d not in self._SKIP_DIRS]
+            if any(name.endswith('.go') for name in files):
+                return True
+        return False
+
     def _get_file_extensions(self) -> list[str]:
         """Get Go file extensions."""
         return ['.go']
@@ -134,15 +264,23 @@ class GoParser(LanguageParser):
         """Get Go initialization files."""
         return []
 
-    def _sanitize_environment(self) -> dict[str, str]:
+    # Computed once on first use - the process environment doesn't change
+    # for the lifetime of a scan, so there's no point rebuilding the
+    # filtered dict for every repo that enters the cache
+    _sanitized_env: dict[str, str] | None = None
+
+    @classmethod
+    def _sanitize_environment(cls) -> dict[str, str]:
         """Create sanitized environment for subprocess execution."""
-        safe_env = {
-            'PATH': os.environ.get('PATH', ''),
-            'HOME': os.environ.get('HOME', ''),
-            'GOPATH': os.environ.get('GOPATH', ''),
-            'GOROOT': os.environ.get('GOROOT', ''),
-            'GO111MODULE': os.environ.get('GO111MODULE', 'on'),
-            'GOPROXY': os.environ.get('GOPROXY', 'https://proxy.golang.org,direct'),
-            'GOSUMDB': os.environ.get('GOSUMDB', 'sum.golang.org'),
-        }
-        return {k: v for k, v in safe_env.items() if v}
+        if cls._sanitized_env is None:
+            safe_env = {
+                'PATH': os.environ.get('PATH', ''),
+                'HOME': os.environ.get('HOME', ''),
+                'GOPATH': os.environ.get('GOPATH', ''),
+                'GOROOT': os.environ.get('GOROOT', ''),
+                'GO111MODULE': os.environ.get('GO111MODULE', 'on'),
+                'GOPROXY': os.environ.get('GOPROXY', 'https://proxy.golang.org,direct'),
+                'GOSUMDB': os.environ.get('GOSUMDB', 'sum.golang.org'),
+            }
+            cls._sanitized_env = {k: v for k, v in safe_env.items() if v}
+        return cls._sanitized_env
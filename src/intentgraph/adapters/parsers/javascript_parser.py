@@ -1,420 +1,446 @@
-"""JavaScript dependency parser using tree-sitter with deterministic analysis."""
-
-import hashlib
-import logging
-from pathlib import Path
-from typing import Optional, Any
-from uuid import UUID
-
-from tree_sitter_language_pack import get_language, get_parser
-
-from .base import LanguageParser
-from ...domain.models import CodeSymbol, APIExport, FunctionDependency
-
-try:
-    from tree_sitter import QueryCursor, Query
-except ImportError:
-    QueryCursor = None
-    Query = None
-
-logger = logging.getLogger(__name__)
-
-
-class JavaScriptParser(LanguageParser):
-    """Parser for JavaScript files using tree-sitter with enhanced structure extraction."""
-
-    _language = None
-    _parser = None
-
-    @classmethod
-    def _get_language(cls):
-        """Lazy initialization of tree-sitter language."""
-        if cls._language is None:
-            cls._language = get_language('javascript')
-        return cls._language
-
-    @classmethod
-    def _get_parser(cls):
-        """Lazy initialization of tree-sitter parser."""
-        if cls._parser is None:
-            cls._parser = get_parser('javascript')
-        return cls._parser
-
-    def extract_dependencies(self, file_path: Path, repo_path: Path) -> list[str]:
-        """Extract JavaScript dependencies using tree-sitter."""
-        dependencies = []
-
-        try:
-            content = file_path.read_bytes()
-            parser = self._get_parser()
-            language = self._get_language()
-            tree = parser.parse(content)
-
-            # Query for import statements
-            query = Query(language, """
-                (import_statement source: (string) @import)
-                (call_expression
-                    function: (identifier) @func
-                    arguments: (arguments (string) @require)
-                    (#eq? @func "require"))
-            """)
-
-            # Use QueryCursor for new tree-sitter API (0.25.x+)
-            cursor = QueryCursor(query)
-            captures_dict = cursor.captures(tree.root_node)
-
-            # Convert dict format to old (node, name) tuple format for compatibility
-            captures = []
-            for capture_name, nodes in captures_dict.items():
-                for node in nodes:
-                    captures.append((node, capture_name))
-
-            for node, capture_name in captures:
-                if capture_name in ['import', 'require']:
-                    import_path = node.text.decode('utf-8').strip('"\'')
-
-                    # Skip external modules (not starting with . or /)
-                    if not import_path.startswith('.') and not import_path.startswith('/'):
-                        continue
-
-                    deps = self._resolve_import_path(import_path, file_path, repo_path)
-                    dependencies.extend(deps)
-
-        except Exception as e:
-            logger.warning(f"Failed to parse JavaScript file {file_path}: {e}")
-
-        # Sort for determinism
-        return sorted(list(set(dependencies)))
-
-    def extract_code_structure(self, file_path: Path, repo_path: Path) -> tuple[
-        list[CodeSymbol],
-        list[APIExport],
-        list[FunctionDependency],
-        list[str],  # imports
-        dict[str, Any]  # metadata
-    ]:
-        """Extract detailed code structure from JavaScript file."""
-        symbols = []
-        exports = []
-        function_deps = []
-        imports = []
-        metadata = {}
-
-        try:
-            content = file_path.read_bytes()
-            text = content.decode('utf-8')
-            lines = text.splitlines()
-
-            parser = self._get_parser()
-            language = self._get_language()
-            tree = parser.parse(content)
-            root = tree.root_node
-
-            # Extract imports (both require and ES6)
-            imports = self._extract_imports(root, text)
-
-            # Extract symbols (functions and classes)
-            symbols = self._extract_symbols(root, text, lines, file_path, repo_path)
-
-            # Extract exports
-            exports = self._extract_exports(root, text, symbols)
-
-            # Calculate metadata
-            metadata = self._calculate_metadata(root, text, len(symbols))
-
-        except Exception as e:
-            logger.warning(f"Failed to extract structure from {file_path}: {e}")
-
-        # Sort for determinism
-        symbols.sort(key=lambda s: (s.line_start, s.symbol_type, s.name))
-        exports.sort(key=lambda e: e.name)
-        imports.sort()
-
-        return symbols, exports, function_deps, imports, metadata
-
-    def _extract_imports(self, root_node, text: str) -> list[str]:
-        """Extract import statements from JavaScript code."""
-        imports = []
-        language = self._get_language()
-
-        # Query for ES6 imports and CommonJS requires
-        query = Query(language, """
-            (import_statement source: (string) @import_source)
-            (call_expression
-                function: (identifier) @func
-                arguments: (arguments (string) @require_source)
-                (#eq? @func "require"))
-        """)
-
-        # Use QueryCursor for new tree-sitter API (0.25.x+)
-        cursor = QueryCursor(query)
-        captures_dict = cursor.captures(root_node)
-
-        # Convert dict format to old (node, name) tuple format for compatibility
-        captures = []
-        for capture_name, nodes in captures_dict.items():
-            for node in nodes:
-                captures.append((node, capture_name))
-
-        for node, capture_name in captures:
-            if capture_name in ['import_source', 'require_source']:
-                import_path = node.text.decode('utf-8').strip('"\'')
-                if capture_name == 'require_source':
-                    imports.append(f"require('{import_path}')")
-                else:
-                    imports.append(f"import ... from '{import_path}'")
-
-        return imports
-
-    def _extract_symbols(self, root_node, text: str, lines: list[str],
-                        file_path: Path, repo_path: Path) -> list[CodeSymbol]:
-        """Extract function and class symbols from JavaScript code."""
-        symbols = []
-        language = self._get_language()
-
-        # Query for functions and classes
-        query = Query(language, """
-            (function_declaration name: (identifier) @func_name) @function
-            (arrow_function) @arrow
-            (class_declaration name: (identifier) @class_name) @class
-            (method_definition name: (property_identifier) @method_name) @method
-            (variable_declarator
-                name: (identifier) @var_name
-                value: [(function_expression) (arrow_function)] @var_func)
-        """)
-
-        # Use QueryCursor for new tree-sitter API (0.25.x+)
-        cursor = QueryCursor(query)
-        captures_dict = cursor.captures(root_node)
-
-        # Convert dict format to old (node, name) tuple format for compatibility
-        captures = []
-        for capture_name, nodes in captures_dict.items():
-            for node in nodes:
-                captures.append((node, capture_name))
-
-        # Group captures by type
-        i = 0
-        while i < len(captures):
-            node, capture_name = captures[i]
-
-            if capture_name == 'function':
-                # Regular function declaration
-                func_name_node = None
-                for j in range(i, min(i + 5, len(captures))):
-                    if captures[j][1] == 'func_name':
-                        func_name_node = captures[j][0]
-                        break
-
-                if func_name_node:
-                    name = func_name_node.text.decode('utf-8')
-                    symbol = self._create_symbol(
-                        name=name,
-                        symbol_type='function',
-                        node=node,
-                        lines=lines,
-                        file_path=file_path,
-                        repo_path=repo_path
-                    )
-                    symbols.append(symbol)
-
-            elif capture_name == 'class':
-                # Class declaration
-                class_name_node = None
-                for j in range(i, min(i + 5, len(captures))):
-                    if captures[j][1] == 'class_name':
-                        class_name_node = captures[j][0]
-                        break
-
-                if class_name_node:
-                    name = class_name_node.text.decode('utf-8')
-                    symbol = self._create_symbol(
-                        name=name,
-                        symbol_type='class',
-                        node=node,
-                        lines=lines,
-                        file_path=file_path,
-                        repo_path=repo_path
-                    )
-                    symbols.append(symbol)
-
-            elif capture_name == 'var_func':
-                # Variable with function/arrow function value
-                var_name_node = None
-                for j in range(max(0, i - 3), i):
-                    if captures[j][1] == 'var_name':
-                        var_name_node = captures[j][0]
-                        break
-
-                if var_name_node:
-                    name = var_name_node.text.decode('utf-8')
-                    symbol = self._create_symbol(
-                        name=name,
-                        symbol_type='function',
-                        node=node,
-                        lines=lines,
-                        file_path=file_path,
-                        repo_path=repo_path
-                    )
-                    symbols.append(symbol)
-
-            i += 1
-
-        return symbols
-
-    def _create_symbol(self, name: str, symbol_type: str, node, lines: list[str],
-                      file_path: Path, repo_path: Path) -> CodeSymbol:
-        """Create a CodeSymbol with deterministic ID."""
-        line_start = node.start_point[0] + 1
-        line_end = node.end_point[0] + 1
-
-        # Generate deterministic ID using canonical path + kind + name + span
-        canonical_path = str(file_path.relative_to(repo_path))
-        span_str = f"{line_start}:{node.start_point[1]}-{line_end}:{node.end_point[1]}"
-        id_string = f"{canonical_path}#{symbol_type}#{name}#{span_str}"
-        symbol_id = UUID(hashlib.sha256(id_string.encode()).hexdigest()[:32])
-
-        # Extract signature (first line of the symbol)
-        signature = None
-        if line_start <= len(lines):
-            signature = lines[line_start - 1].strip()
-
-        # Check if exported (simplified - would need more context for full accuracy)
-        is_exported = False
-
-        return CodeSymbol(
-            name=name,
-            symbol_type=symbol_type,
-            line_start=line_start,
-            line_end=line_end,
-            signature=signature,
-            docstring=None,  # JavaScript doesn't have standard docstrings
-            is_exported=is_exported,
-            is_private=name.startswith('_'),
-            decorators=[],
-            parent=None,
-            id=symbol_id
-        )
-
-    def _extract_exports(self, root_node, text: str, symbols: list[CodeSymbol]) -> list[APIExport]:
-        """Extract export statements from JavaScript code."""
-        exports = []
-        language = self._get_language()
-
-        # Query for various export patterns
-        query = Query(language, """
-            (export_statement) @export
-            (export_clause (export_specifier name: (identifier) @export_name))
-            (assignment_expression
-                left: (member_expression
-                    object: (identifier) @module
-                    property: (property_identifier) @exports_prop)
-                (#eq? @module "module")
-                (#eq? @exports_prop "exports"))
-        """)
-
-        # Use QueryCursor for new tree-sitter API (0.25.x+)
-        cursor = QueryCursor(query)
-        captures_dict = cursor.captures(root_node)
-
-        # Convert dict format to old (node, name) tuple format for compatibility
-        captures = []
-        for capture_name, nodes in captures_dict.items():
-            for node in nodes:
-                captures.append((node, capture_name))
-
-        # Create a symbol name to ID mapping
-        symbol_map = {s.name: s.id for s in symbols}
-
-        for node, capture_name in captures:
-            if capture_name == 'export_name':
-                name = node.text.decode('utf-8')
-                export = APIExport(
-                    name=name,
-                    export_type='unknown',
-                    symbol_id=symbol_map.get(name),
-                    is_reexport=False,
-                    original_module=None,
-                    docstring=None
-                )
-                exports.append(export)
-
-        return exports
-
-    def _calculate_metadata(self, root_node, text: str, symbol_count: int) -> dict[str, Any]:
-        """Calculate metadata including complexity metrics."""
-        metadata = {}
-
-        # Count control flow nodes for complexity
-        language = self._get_language()
-        complexity_query = Query(language, """
-            (if_statement) @if
-            (while_statement) @while
-            (for_statement) @for
-            (switch_statement) @switch
-            (catch_clause) @catch
-            (binary_expression operator: ["&&" "||"]) @logical
-        """)
-
-        # Use QueryCursor for new tree-sitter API (0.25.x+)
-        cursor = QueryCursor(complexity_query)
-        captures_dict = cursor.captures(root_node)
-
-        # Convert dict format to old (node, name) tuple format for compatibility
-        captures = []
-        for capture_name, nodes in captures_dict.items():
-            for node in nodes:
-                captures.append((node, capture_name))
-        complexity = len(captures) + 1  # Base complexity of 1
-
-        metadata['complexity_score'] = complexity
-        metadata['symbol_count'] = symbol_count
-
-        return metadata
-
-    def _resolve_import_path(self, import_path: str, file_path: Path, repo_path: Path) -> list[str]:
-        """Resolve JavaScript import path."""
-        resolved_paths = []
-
-        if import_path.startswith('./') or import_path.startswith('../'):
-            # Relative import
-            base_dir = file_path.parent
-            target_path = (base_dir / import_path).resolve()
-        elif import_path.startswith('/'):
-            # Absolute import from repo root
-            target_path = repo_path / import_path[1:]
-        else:
-            # Module import from node_modules or similar
-            return []
-
-        # Try different extensions
-        extensions = self._get_file_extensions()
-        for ext in extensions:
-            candidate = target_path.with_suffix(ext)
-            if candidate.exists() and candidate.is_file():
-                try:
-                    rel_path = candidate.relative_to(repo_path)
-                    resolved_paths.append(str(rel_path))
-                except ValueError:
-                    pass
-
-        # Try directory with index file
-        if target_path.is_dir():
-            for index_name in self._get_init_files():
-                index_file = target_path / index_name
-                if index_file.exists():
-                    try:
-                        rel_path = index_file.relative_to(repo_path)
-                        resolved_paths.append(str(rel_path))
-                    except ValueError:
-                        pass
-
-        return resolved_paths
-
-    def _get_file_extensions(self) -> list[str]:
-        """Get JavaScript file extensions."""
-        return ['.js', '.jsx']
-
-    def _get_init_files(self) -> list[str]:
-        """Get JavaScript initialization files."""
-        return ['index.js', 'index.jsx']
+"""JavaScript dependency parser using tree-sitter with deterministic analysis."""
+
+import functools
+import hashlib
+import logging
+import stat
+import threading
+from pathlib import Path
+from typing import Optional, Any
+from uuid import UUID
+
+from tree_sitter_language_pack import get_language, get_parser
+
+from .base import LanguageParser
+from ...domain.models import CodeSymbol, APIExport, FunctionDependency
+
+try:
+    from tree_sitter import QueryCursor, Query
+except ImportError:
+    QueryCursor = None
+    Query = None
+
+logger = logging.getLogger(__name__)
+
+
+# Single unified query covering imports, symbols, exports and control-flow
+# nodes. Running it once per file replaces four separate query passes that
+# each walked the full tree in C; capture names route nodes to their purpose.
+_UNIFIED_QUERY_SRC = """
+    (import_statement source: (string) @import_source)
+    (call_expression
+        function: (identifier) @require_func
+        arguments: (arguments (string) @require_source)
+        (#eq? @require_func "require"))
+    (function_declaration name: (identifier) @func_name) @function
+    (arrow_function) @arrow
+    (class_declaration name: (identifier) @class_name) @class
+    (method_definition name: (property_identifier) @method_name) @method
+    (variable_declarator
+        name: (identifier) @var_name
+        value: [(function_expression) (arrow_function)] @var_func)
+    (export_clause (export_specifier name: (identifier) @export_name))
+    (if_statement) @if
+    (while_statement) @while
+    (for_statement) @for
+    (switch_statement) @switch
+    (catch_clause) @catch
+    (binary_expression operator: ["&&" "||"]) @logical
+"""
+
+# Capture names from the unified query that feed the complexity score
+_COMPLEXITY_CAPTURES = frozenset({'if', 'while', 'for', 'switch', 'catch', 'logical'})
+
+
+def _line_offsets(content: bytes) -> list[int]:
+    """Return the byte offset of each line start in content.
+
+    Signatures only need one source line per symbol, so slicing them out
+    of the bytes buffer on demand avoids materializing a full decoded
+    string plus a list of line strings for every file.
+    """
+    offsets = [0]
+    find = content.find
+    pos = find(b'\n')
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = find(b'\n', pos + 1)
+    return offsets
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_file(path_str: str, mtime_ns: int) -> tuple[bytes, Any, dict[str, list]]:
+    """Read, parse and query a file once per (path, mtime) pair.
+
+    Callers typically run both extract_dependencies and
+    extract_code_structure on the same file; memoizing on the mtime stamp
+    means the bytes are read, the tree built and the unified query run a
+    single time. Trees are cheap to keep alive and the cache is bounded.
+    """
+    content = Path(path_str).read_bytes()
+    tree = JavaScriptParser._get_parser().parse(content)
+    query = JavaScriptParser._get_query('unified', _UNIFIED_QUERY_SRC)
+    captures = QueryCursor(query).captures(tree.root_node)
+    return content, tree, captures
+
+
+class JavaScriptParser(LanguageParser):
+    """Parser for JavaScript files using tree-sitter with enhanced structure extraction."""
+
+    _language = None
+    # tree-sitter Parser objects are not thread-safe, so each thread gets
+    # its own; Language and compiled Query objects are safe to share
+    _thread_state = threading.local()
+    # Compiled tree-sitter Query objects, keyed by query name. Compiling
+    # an S-expression pattern is not free; caching here mirrors the
+    # _language/_parser lazy singletons and amortizes it across all files.
+    _queries: dict[str, Any] = {}
+    # Finished extraction results keyed by (path, mtime_ns, size). Repeat
+    # analyses (incremental runs, watch loops) skip the whole pipeline for
+    # files whose stamp has not changed.
+    _structure_cache: dict[tuple[str, int, int], tuple] = {}
+    _STRUCTURE_CACHE_MAX = 1024
+    # Name-capture key -> symbol type dispatch driving _extract_symbols
+    _SYMBOL_CAPTURES: tuple[tuple[str, str], ...] = (
+        ('func_name', 'function'),
+        ('class_name', 'class'),
+        ('var_name', 'function'),
+    )
+
+    @classmethod
+    def _get_language(cls):
+        """Lazy initialization of tree-sitter language."""
+        if cls._language is None:
+            cls._language = get_language('javascript')
+        return cls._language
+
+    @classmethod
+    def _get_query(cls, key: str, source: str):
+        """Lazily compile and memoize a tree-sitter query."""
+        query = cls._queries.get(key)
+        if query is None:
+            query = Query(cls._get_language(), source)
+            cls._queries[key] = query
+        return query
+
+    @classmethod
+    def _get_parser(cls):
+        """Lazy initialization of a per-thread tree-sitter parser."""
+        parser = getattr(cls._thread_state, 'parser', None)
+        if parser is None:
+            parser = get_parser('javascript')
+            cls._thread_state.parser = parser
+        return parser
+
+    @classmethod
+    def _parse_once(cls, file_path: Path) -> tuple[bytes, Any, dict[str, list]]:
+        """Return (content, tree, unified captures) via the mtime-keyed cache."""
+        try:
+            stamp = file_path.stat().st_mtime_ns
+        except OSError:
+            stamp = -1
+        return _parse_file(str(file_path), stamp)
+
+    def extract_dependencies(self, file_path: Path, repo_path: Path) -> list[str]:
+        """Extract JavaScript dependencies using tree-sitter."""
+        dependencies: set[str] = set()
+
+        try:
+            # Reuse the parse + unified query shared with extract_code_structure
+            _content, _tree, captures = self._parse_once(file_path)
+
+            import_nodes = captures.get('import_source', [])
+            require_nodes = captures.get('require_source', [])
+            if not import_nodes and not require_nodes:
+                return []
+            for node in (*import_nodes, *require_nodes):
+                # Strip quotes as bytes, then decode once
+                import_path = node.text.strip(b'"\'').decode('utf-8')
+
+                # Skip external modules (not starting with . or /)
+                if not import_path.startswith(('.', '/')):
+                    continue
+
+                deps = self._resolve_import_path(import_path, file_path, repo_path)
+                dependencies.update(deps)
+
+        except Exception as e:
+            logger.warning(f"Failed to parse JavaScript file {file_path}: {e}")
+
+        # Sort for determinism; deduped as it was built
+        return sorted(dependencies)
+
+    def extract_code_structure(self, file_path: Path, repo_path: Path) -> tuple[
+        list[CodeSymbol],
+        list[APIExport],
+        list[FunctionDependency],
+        list[str],  # imports
+        dict[str, Any]  # metadata
+    ]:
+        """Extract detailed code structure from JavaScript file."""
+        symbols = []
+        exports = []
+        function_deps = []
+        imports = []
+        metadata = {}
+
+        # Unchanged files return their memoized result without touching
+        # the parse or extraction pipeline at all
+        try:
+            st = file_path.stat()
+            cache_key = (str(file_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            cache_key = None
+        if cache_key is not None:
+            cached = self._structure_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            content, _tree, captures = self._parse_once(file_path)
+
+            # Line offsets only feed symbol signatures; skip the scan
+            # entirely for files that define no symbols (config files,
+            # bundles, fixtures), which is the common case in large repos
+            if (captures.get('func_name') or captures.get('class_name')
+                    or captures.get('var_name')):
+                line_offsets = _line_offsets(content)
+            else:
+                line_offsets = []
+
+            # Every symbol ID shares the same canonical-path prefix; hash
+            # it once into a base hasher that symbol creation copies, so
+            # the prefix bytes are encoded and digested once per file
+            canonical_path = str(file_path.relative_to(repo_path))
+            base_hasher = hashlib.sha256(canonical_path.encode() + b'#')
+
+            # Extract imports (both require and ES6)
+            imports = self._extract_imports(captures)
+
+            # Extract symbols (functions and classes)
+            symbols = self._extract_symbols(captures, content, line_offsets,
+                                            base_hasher)
+
+            # Extract exports
+            exports = self._extract_exports(captures, symbols)
+
+            # Calculate metadata
+            metadata = self._calculate_metadata(captures, len(symbols))
+
+        except Exception as e:
+            logger.warning(f"Failed to extract structure from {file_path}: {e}")
+
+        # Sort for determinism
+        symbols.sort(key=lambda s: (s.line_start, s.symbol_type, s.name))
+        exports.sort(key=lambda e: e.name)
+        imports.sort()
+
+        result = (symbols, exports, function_deps, imports, metadata)
+        if cache_key is not None:
+            if len(self._structure_cache) >= self._STRUCTURE_CACHE_MAX:
+                self._structure_cache.clear()
+            self._structure_cache[cache_key] = result
+        return result
+
+    def _extract_imports(self, captures: dict[str, list]) -> list[str]:
+        """Extract import statements from the unified query captures."""
+        imports = []
+
+        for node in captures.get('import_source', []):
+            import_path = node.text.strip(b'"\'').decode('utf-8')
+            imports.append(f"import ... from '{import_path}'")
+
+        for node in captures.get('require_source', []):
+            import_path = node.text.strip(b'"\'').decode('utf-8')
+            imports.append(f"require('{import_path}')")
+
+        return imports
+
+    def _extract_symbols(self, captures: dict[str, list], content: bytes,
+                        line_offsets: list[int],
+                        base_hasher) -> list[CodeSymbol]:
+        """Extract function and class symbols from the unified query captures."""
+        symbols = []
+
+        # Index anchor nodes by the id of the node their name capture hangs
+        # off: a function/class anchor is the name's direct parent, while a
+        # var_func value shares its variable_declarator parent with the
+        # name. Name-to-anchor association is then one dict probe per
+        # symbol, independent of capture ordering.
+        anchor_by_id: dict[int, Any] = {}
+        for node in captures.get('function', []):
+            anchor_by_id[node.id] = node
+        for node in captures.get('class', []):
+            anchor_by_id[node.id] = node
+        for node in captures.get('var_func', []):
+            anchor_by_id[node.parent.id] = node
+
+        for capture_key, symbol_type in self._SYMBOL_CAPTURES:
+            for name_node in captures.get(capture_key, []):
+                anchor = anchor_by_id.get(name_node.parent.id)
+                if anchor is None:
+                    continue
+                symbols.append(self._create_symbol(
+                    name_bytes=name_node.text,
+                    symbol_type=symbol_type,
+                    node=anchor,
+                    content=content,
+                    line_offsets=line_offsets,
+                    base_hasher=base_hasher,
+                ))
+
+        return symbols
+
+    def _create_symbol(self, name_bytes: bytes, symbol_type: str, node, content: bytes,
+                      line_offsets: list[int],
+                      base_hasher) -> CodeSymbol:
+        """Create a CodeSymbol with deterministic ID."""
+        line_start = node.start_point[0] + 1
+        line_end = node.end_point[0] + 1
+
+        # Generate deterministic ID using canonical path + kind + name + span.
+        # base_hasher already digested the shared "{canonical_path}#" prefix;
+        # copying it and appending the per-symbol suffix hashes the same
+        # bytes as before without re-hashing the prefix for every symbol.
+        span_str = f"{line_start}:{node.start_point[1]}-{line_end}:{node.end_point[1]}"
+        hasher = base_hasher.copy()
+        hasher.update(b"%b#%b#%b" % (symbol_type.encode(), name_bytes, span_str.encode()))
+        # digest()[:16] is the same 128 bits hexdigest()[:32] spelled, minus
+        # the 64-char hex string allocation per symbol. The UUID wrapper is
+        # required here: CodeSymbol.id and APIExport.symbol_id are typed as
+        # UUID across the domain layer and serialized as such.
+        symbol_id = UUID(bytes=hasher.digest()[:16])
+        name = name_bytes.decode('utf-8')
+
+        # Extract signature (first line of the symbol), sliced straight
+        # from the bytes buffer via the precomputed line offsets
+        signature = None
+        if line_start <= len(line_offsets):
+            start = line_offsets[line_start - 1]
+            if line_start < len(line_offsets):
+                end = line_offsets[line_start] - 1
+            else:
+                end = len(content)
+            signature = content[start:end].decode('utf-8', 'replace').strip()
+
+        # Check if exported (simplified - would need more context for full accuracy)
+        is_exported = False
+
+        return CodeSymbol(
+            name=name,
+            symbol_type=symbol_type,
+            line_start=line_start,
+            line_end=line_end,
+            signature=signature,
+            docstring=None,  # JavaScript doesn't have standard docstrings
+            is_exported=is_exported,
+            is_private=name.startswith('_'),
+            decorators=[],
+            parent=None,
+            id=symbol_id
+        )
+
+    def _extract_exports(self, captures: dict[str, list],
+                        symbols: list[CodeSymbol]) -> list[APIExport]:
+        """Extract export statements from the unified query captures."""
+        # Most files export nothing; bail before building the symbol map
+        export_nodes = captures.get('export_name')
+        if not export_nodes:
+            return []
+
+        exports = []
+
+        # Create a symbol name to ID mapping
+        symbol_map = {s.name: s.id for s in symbols}
+
+        for node in export_nodes:
+            name = node.text.decode('utf-8')
+            export = APIExport(
+                name=name,
+                export_type='unknown',
+                symbol_id=symbol_map.get(name),
+                is_reexport=False,
+                original_module=None,
+                docstring=None
+            )
+            exports.append(export)
+
+        return exports
+
+    def _calculate_metadata(self, captures: dict[str, list],
+                           symbol_count: int) -> dict[str, Any]:
+        """Calculate metadata including complexity metrics."""
+        # Control-flow nodes were captured by the unified query already;
+        # the score is a tally of capture-list lengths, so no node list is
+        # flattened or materialized just to be counted
+        complexity = 1 + sum(
+            len(captures.get(name, ())) for name in _COMPLEXITY_CAPTURES
+        )
+
+        return {
+            'complexity_score': complexity,
+            'symbol_count': symbol_count,
+        }
+
+    def _resolve_import_path(self, import_path: str, file_path: Path, repo_path: Path) -> list[str]:
+        """Resolve JavaScript import path."""
+        resolved_paths = []
+
+        if import_path.startswith(('./', '../')):
+            # Relative import
+            base_dir = file_path.parent
+            target_path = (base_dir / import_path).resolve()
+        elif import_path.startswith('/'):
+            # Absolute import from repo root
+            target_path = repo_path / import_path[1:]
+        else:
+            # Module import from node_modules or similar
+            return []
+
+        # Try different extensions; one stat() per candidate replaces the
+        # separate exists()/is_file() syscall pair
+        for ext in self._EXTENSIONS:
+            candidate = target_path.with_suffix(ext)
+            try:
+                st = candidate.stat()
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                try:
+                    rel_path = candidate.relative_to(repo_path)
+                    resolved_paths.append(str(rel_path))
+                except ValueError:
+                    pass
+
+        # Try directory with index file
+        try:
+            is_dir = stat.S_ISDIR(target_path.stat().st_mode)
+        except OSError:
+            is_dir = False
+        if is_dir:
+            for index_name in self._INIT_FILES:
+                index_file = target_path / index_name
+                try:
+                    st = index_file.stat()
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    try:
+                        rel_path = index_file.relative_to(repo_path)
+                        resolved_paths.append(str(rel_path))
+                    except ValueError:
+                        pass
+
+        return resolved_paths
+
+    # Constant tuples so per-import resolution allocates nothing
+    _EXTENSIONS: tuple[str, ...] = ('.js', '.jsx')
+    _INIT_FILES: tuple[str, ...] = ('index.js', 'index.jsx')
+
+    def _get_file_extensions(self) -> list[str]:
+        """Get JavaScript file extensions."""
+        return list(self._EXTENSIONS)
+
+    def _get_init_files(self) -> list[str]:
+        """Get JavaScript initialization files."""
+        return list(self._INIT_FILES)
@@ -1,535 +1,455 @@
-"""TypeScript dependency parser using tree-sitter."""
-
-import hashlib
-import logging
-from pathlib import Path
-from typing import Optional, Any
-from uuid import UUID, uuid4
-
-from .base import LanguageParser
-from ...domain.models import CodeSymbol, APIExport, FunctionDependency
-
-try:
-    from tree_sitter import QueryCursor
-except ImportError:
-    QueryCursor = None
-
-logger = logging.getLogger(__name__)
-
-
-class TypeScriptParser(LanguageParser):
-    """Parser for TypeScript files using tree-sitter with lazy initialization."""
-
-    def __init__(self):
-        self._language = None
-        self._parser = None
-        self._init_error = None
-        self._symbol_map = {}  # Maps symbol names to UUIDs
-
-    def _ensure_initialized(self) -> bool:
-        """Lazy initialization of tree-sitter components."""
-        if self._parser is not None:
-            return True
-        if self._init_error is not None:
-            return False
-
-        try:
-            from tree_sitter_language_pack import get_language, get_parser
-            self._language = get_language('typescript')
-            self._parser = get_parser('typescript')
-            return True
-        except Exception as e:
-            self._init_error = e
-            logger.warning(f"Failed to initialize tree-sitter for TypeScript: {e}")
-            return False
-
-    def extract_dependencies(self, file_path: Path, repo_path: Path) -> list[str]:
-        """Extract TypeScript dependencies using tree-sitter."""
-        if not self._ensure_initialized():
-            logger.warning(f"Cannot extract dependencies from {file_path}: tree-sitter not available")
-            return []
-
-        dependencies = []
-
-        try:
-            content = file_path.read_bytes()
-            tree = self._parser.parse(content)
-
-            # Query for import statements
-            from tree_sitter import Query
-            query = Query(self._language, """
-                (import_statement source: (string) @import)
-                (call_expression
-                    function: (identifier) @func
-                    arguments: (arguments (string) @require)
-                    (#eq? @func "require"))
-                (import_statement
-                    source: (string) @dynamic_import)
-            """)
-
-            # Use QueryCursor for new tree-sitter API (0.25.x+)
-            cursor = QueryCursor(query)
-            captures_dict = cursor.captures(tree.root_node)
-
-            # Convert dict format to old (node, name) tuple format for compatibility
-            captures = []
-            for capture_name, nodes in captures_dict.items():
-                for node in nodes:
-                    captures.append((node, capture_name))
-
-            for node, capture_name in captures:
-                if capture_name in ['import', 'require', 'dynamic_import']:
-                    import_path = node.text.decode('utf-8').strip('"\'')
-
-                    # Skip external modules
-                    if not import_path.startswith('.') and not import_path.startswith('/'):
-                        continue
-
-                    deps = self._resolve_import_path(import_path, file_path, repo_path)
-                    dependencies.extend(deps)
-
-        except Exception as e:
-            logger.warning(f"Failed to parse TypeScript file {file_path}: {e}")
-
-        return dependencies
-
-    def extract_code_structure(self, file_path: Path, repo_path: Path) -> tuple[
-        list[CodeSymbol],
-        list[APIExport],
-        list[FunctionDependency],
-        list[str],  # imports
-        dict[str, Any]  # metadata
-    ]:
-        """Extract detailed code structure from TypeScript file.
-
-        Returns:
-            Tuple of (symbols, exports, function_deps, imports, metadata)
-        """
-        if not self._ensure_initialized():
-            logger.warning(f"Cannot extract code structure from {file_path}: tree-sitter not available")
-            return [], [], [], [], {}
-
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            content_bytes = content.encode('utf-8')
-            tree = self._parser.parse(content_bytes)
-
-            # Extract symbols (pass file_path for deterministic IDs)
-            symbols = self._extract_symbols(tree.root_node, file_path, content)
-
-            # Build symbol map for dependencies
-            self._symbol_map = {s.name: s.id for s in symbols}
-
-            # Extract imports
-            imports = self._extract_imports(tree.root_node)
-
-            # Extract exports
-            exports = self._extract_api_exports(tree.root_node, symbols)
-
-            # Calculate metadata
-            metadata = self._calculate_metadata(tree.root_node, content)
-
-            # Sort for determinism
-            symbols = sorted(symbols, key=lambda s: (s.line_start, s.symbol_type, s.name))
-            exports = sorted(exports, key=lambda e: e.name)
-            imports = sorted(imports)
-
-            return symbols, exports, [], imports, metadata
-
-        except Exception as e:
-            logger.warning(f"Failed to extract code structure from {file_path}: {e}")
-            return [], [], [], [], {}
-
-    def _extract_symbols(self, node, file_path: Path, content: str) -> list[CodeSymbol]:
-        """Extract all code symbols from the AST."""
-        symbols = []
-        file_path_str = str(file_path)
-
-        def traverse(node, parent=None):
-            node_type = node.type
-
-            # Functions
-            if node_type in ('function_declaration', 'method_definition', 'arrow_function'):
-                symbol = self._create_function_symbol(node, file_path_str, content, parent)
-                if symbol:
-                    symbols.append(symbol)
-                    traverse_children(node, symbol.name)
-                    return
-
-            # Classes
-            elif node_type == 'class_declaration':
-                symbol = self._create_class_symbol(node, file_path_str, content)
-                if symbol:
-                    symbols.append(symbol)
-                    traverse_children(node, symbol.name)
-                    return
-
-            # Interfaces
-            elif node_type == 'interface_declaration':
-                symbol = self._create_interface_symbol(node, file_path_str, content)
-                if symbol:
-                    symbols.append(symbol)
-
-            # Type aliases
-            elif node_type == 'type_alias_declaration':
-                symbol = self._create_type_symbol(node, file_path_str, content)
-                if symbol:
-                    symbols.append(symbol)
-
-            # Enums
-            elif node_type == 'enum_declaration':
-                symbol = self._create_enum_symbol(node, file_path_str, content)
-                if symbol:
-                    symbols.append(symbol)
-
-            traverse_children(node, parent)
-
-        def traverse_children(node, parent):
-            for child in node.children:
-                traverse(child, parent)
-
-        traverse(node)
-        return symbols
-
-    def _create_function_symbol(self, node, file_path_str: str, content: str, parent: Optional[str] = None) -> Optional[CodeSymbol]:
-        """Create a CodeSymbol for a function."""
-        try:
-            # Get function name
-            name_node = self._find_child_by_field(node, 'name')
-            if not name_node:
-                return None
-            name = self._get_node_text(name_node, content)
-
-            # Get signature
-            signature = self._get_node_text(node, content).split('\n')[0][:200]  # First line, truncated
-
-            # Determine if exported
-            is_exported = self._is_exported(node)
-            is_private = name.startswith('_')
-
-            # Get position
-            line_start = node.start_point[0] + 1
-            line_end = node.end_point[0] + 1
-
-            # Generate deterministic ID
-            symbol_id = self._generate_symbol_id(file_path_str, 'function', name, line_start)
-
-            return CodeSymbol(
-                name=name,
-                symbol_type='function',
-                line_start=line_start,
-                line_end=line_end,
-                signature=signature,
-                is_exported=is_exported,
-                is_private=is_private,
-                parent=parent,
-                id=symbol_id
-            )
-        except Exception as e:
-            logger.debug(f"Failed to create function symbol: {e}")
-            return None
-
-    def _create_class_symbol(self, node, file_path_str: str, content: str) -> Optional[CodeSymbol]:
-        """Create a CodeSymbol for a class."""
-        try:
-            # Get class name
-            name_node = self._find_child_by_field(node, 'name')
-            if not name_node:
-                return None
-            name = self._get_node_text(name_node, content)
-
-            # Get signature (simplified)
-            signature = f"class {name}"
-
-            # Determine if exported
-            is_exported = self._is_exported(node)
-            is_private = name.startswith('_')
-
-            # Get position
-            line_start = node.start_point[0] + 1
-            line_end = node.end_point[0] + 1
-
-            # Generate deterministic ID
-            symbol_id = self._generate_symbol_id(file_path_str, 'class', name, line_start)
-
-            return CodeSymbol(
-                name=name,
-                symbol_type='class',
-                line_start=line_start,
-                line_end=line_end,
-                signature=signature,
-                is_exported=is_exported,
-                is_private=is_private,
-                id=symbol_id
-            )
-        except Exception as e:
-            logger.debug(f"Failed to create class symbol: {e}")
-            return None
-
-    def _create_interface_symbol(self, node, file_path_str: str, content: str) -> Optional[CodeSymbol]:
-        """Create a CodeSymbol for an interface."""
-        try:
-            # Get interface name
-            name_node = self._find_child_by_field(node, 'name')
-            if not name_node:
-                return None
-            name = self._get_node_text(name_node, content)
-
-            # Get signature
-            signature = f"interface {name}"
-
-            # Determine if exported
-            is_exported = self._is_exported(node)
-
-            # Get position
-            line_start = node.start_point[0] + 1
-            line_end = node.end_point[0] + 1
-
-            # Generate deterministic ID
-            symbol_id = self._generate_symbol_id(file_path_str, 'interface', name, line_start)
-
-            return CodeSymbol(
-                name=name,
-                symbol_type='interface',
-                line_start=line_start,
-                line_end=line_end,
-                signature=signature,
-                is_exported=is_exported,
-                id=symbol_id
-            )
-        except Exception as e:
-            logger.debug(f"Failed to create interface symbol: {e}")
-            return None
-
-    def _create_type_symbol(self, node, file_path_str: str, content: str) -> Optional[CodeSymbol]:
-        """Create a CodeSymbol for a type alias."""
-        try:
-            # Get type name
-            name_node = self._find_child_by_field(node, 'name')
-            if not name_node:
-                return None
-            name = self._get_node_text(name_node, content)
-
-            # Get signature (simplified)
-            signature = f"type {name}"
-
-            # Determine if exported
-            is_exported = self._is_exported(node)
-
-            # Get position
-            line_start = node.start_point[0] + 1
-            line_end = node.end_point[0] + 1
-
-            # Generate deterministic ID
-            symbol_id = self._generate_symbol_id(file_path_str, 'type', name, line_start)
-
-            return CodeSymbol(
-                name=name,
-                symbol_type='type',
-                line_start=line_start,
-                line_end=line_end,
-                signature=signature,
-                is_exported=is_exported,
-                id=symbol_id
-            )
-        except Exception as e:
-            logger.debug(f"Failed to create type symbol: {e}")
-            return None
-
-    def _create_enum_symbol(self, node, file_path_str: str, content: str) -> Optional[CodeSymbol]:
-        """Create a CodeSymbol for an enum."""
-        try:
-            # Get enum name
-            name_node = self._find_child_by_field(node, 'name')
-            if not name_node:
-                return None
-            name = self._get_node_text(name_node, content)
-
-            # Get signature
-            signature = f"enum {name}"
-
-            # Determine if exported
-            is_exported = self._is_exported(node)
-
-            # Get position
-            line_start = node.start_point[0] + 1
-            line_end = node.end_point[0] + 1
-
-            # Generate deterministic ID
-            symbol_id = self._generate_symbol_id(file_path_str, 'enum', name, line_start)
-
-            return CodeSymbol(
-                name=name,
-                symbol_type='enum',
-                line_start=line_start,
-                line_end=line_end,
-                signature=signature,
-                is_exported=is_exported,
-                id=symbol_id
-            )
-        except Exception as e:
-            logger.debug(f"Failed to create enum symbol: {e}")
-            return None
-
-    def _extract_imports(self, node) -> list[str]:
-        """Extract all import statements."""
-        imports = []
-
-        def traverse(node):
-            if node.type == 'import_statement':
-                import_text = self._reconstruct_import(node)
-                if import_text:
-                    imports.append(import_text)
-
-            for child in node.children:
-                traverse(child)
-
-        traverse(node)
-        return imports
-
-    def _reconstruct_import(self, node) -> Optional[str]:
-        """Reconstruct import statement as string."""
-        try:
-            # Find the string literal (source)
-            source_node = self._find_child_by_field(node, 'source')
-            if source_node:
-                source = source_node.text.decode('utf-8').strip('"\'')
-                return f"import ... from '{source}'"
-            return None
-        except Exception:
-            return None
-
-    def _extract_api_exports(self, node, symbols: list[CodeSymbol]) -> list[APIExport]:
-        """Extract exported APIs."""
-        exports = []
-        exported_names = set()
-
-        def traverse(node):
-            # Check for export keywords
-            if node.type in ('export_statement', 'export_declaration'):
-                # Get exported names
-                for child in node.children:
-                    if child.type in ('function_declaration', 'class_declaration',
-                                     'interface_declaration', 'type_alias_declaration',
-                                     'enum_declaration'):
-                        name_node = self._find_child_by_field(child, 'name')
-                        if name_node:
-                            exported_names.add(name_node.text.decode('utf-8'))
-
-            for child in node.children:
-                traverse(child)
-
-        traverse(node)
-
-        # Create exports for exported symbols
-        for symbol in symbols:
-            if symbol.name in exported_names or symbol.is_exported:
-                export = APIExport(
-                    name=symbol.name,
-                    export_type=symbol.symbol_type,
-                    symbol_id=symbol.id
-                )
-                exports.append(export)
-
-        return exports
-
-    def _calculate_metadata(self, node, content: str) -> dict[str, Any]:
-        """Calculate code metrics."""
-        metadata = {
-            'total_functions': 0,
-            'total_classes': 0,
-            'total_interfaces': 0,
-            'total_types': 0,
-            'total_enums': 0,
-            'lines_of_code': len([line for line in content.splitlines() if line.strip()])
-        }
-
-        def traverse(node):
-            if node.type in ('function_declaration', 'method_definition', 'arrow_function'):
-                metadata['total_functions'] += 1
-            elif node.type == 'class_declaration':
-                metadata['total_classes'] += 1
-            elif node.type == 'interface_declaration':
-                metadata['total_interfaces'] += 1
-            elif node.type == 'type_alias_declaration':
-                metadata['total_types'] += 1
-            elif node.type == 'enum_declaration':
-                metadata['total_enums'] += 1
-
-            for child in node.children:
-                traverse(child)
-
-        traverse(node)
-        return metadata
-
-    def _is_exported(self, node) -> bool:
-        """Check if node is exported."""
-        # Traverse up to parent to check for export keyword
-        parent = node.parent
-        while parent:
-            if parent.type in ('export_statement', 'export_declaration'):
-                return True
-            parent = parent.parent
-        return False
-
-    def _find_child_by_field(self, node, field_name: str):
-        """Find child node by field name."""
-        return node.child_by_field_name(field_name)
-
-    def _get_node_text(self, node, content: str) -> str:
-        """Get text content of a node."""
-        return node.text.decode('utf-8')
-
-    def _generate_symbol_id(self, file_path: str, kind: str, name: str, line: int) -> UUID:
-        """Generate deterministic symbol ID using SHA256."""
-        canonical = f"{file_path}:{kind}:{name}:{line}"
-        hash_bytes = hashlib.sha256(canonical.encode('utf-8')).digest()
-        # Convert first 16 bytes to UUID
-        return UUID(bytes=hash_bytes[:16])
-
-    def _resolve_import_path(self, import_path: str, file_path: Path, repo_path: Path) -> list[str]:
-        """Resolve TypeScript import path."""
-        resolved_paths = []
-
-        if import_path.startswith('./') or import_path.startswith('../'):
-            # Relative import
-            base_dir = file_path.parent
-            target_path = (base_dir / import_path).resolve()
-        elif import_path.startswith('/'):
-            # Absolute import from repo root
-            target_path = repo_path / import_path[1:]
-        else:
-            # Module import
-            return []
-
-        # Try different extensions
-        extensions = self._get_file_extensions()
-        for ext in extensions:
-            candidate = target_path.with_suffix(ext)
-            if candidate.exists() and candidate.is_file():
-                try:
-                    rel_path = candidate.relative_to(repo_path)
-                    resolved_paths.append(str(rel_path))
-                except ValueError:
-                    pass
-
-        # Try directory with index file
-        if target_path.is_dir():
-            for index_name in self._get_init_files():
-                index_file = target_path / index_name
-                if index_file.exists():
-                    try:
-                        rel_path = index_file.relative_to(repo_path)
-                        resolved_paths.append(str(rel_path))
-                    except ValueError:
-                        pass
-
-        return resolved_paths
-
-    def _get_file_extensions(self) -> list[str]:
-        """Get TypeScript file extensions."""
-        return ['.ts', '.tsx', '.js', '.jsx']
-
-    def _get_init_files(self) -> list[str]:
-        """Get TypeScript initialization files."""
-        return ['index.ts', 'index.tsx', 'index.js', 'index.jsx']
+"""TypeScript dependency parser using tree-sitter."""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Any
+from uuid import UUID, uuid4
+
+from .base import LanguageParser
+from ...domain.models import CodeSymbol, APIExport, FunctionDependency
+
+try:
+    from tree_sitter import QueryCursor
+except ImportError:
+    QueryCursor = None
+
+logger = logging.getLogger(__name__)
+
+
+# Shared tree-sitter state. Loading the TypeScript grammar means a dlopen
+# plus a grammar-table copy, and query compilation is C work worth doing
+# once - so the Language/Parser/Query live at module scope and every
+# TypeScriptParser instance reuses them.
+_LANG = None
+_PARSER = None
+_IMPORT_QUERY = None
+_INIT_LOCK = threading.Lock()
+
+# Pre-encoded symbol kinds: the ID canonical form is built in bytes, so
+# the five literal kinds never re-encode per symbol
+_KIND_BYTES = {
+    'function': b'function',
+    'class': b'class',
+    'interface': b'interface',
+    'type': b'type',
+    'enum': b'enum',
+}
+
+# Matches each line containing at least one non-whitespace character;
+# one findall on bytes replaces a per-line splitlines/strip loop
+_NON_BLANK = re.compile(rb'(?m)^[^\S\n]*\S')
+
+_IMPORT_QUERY_SRC = """
+    (import_statement source: (string) @import)
+    (call_expression
+        function: (identifier) @func
+        arguments: (arguments (string) @require)
+        (#eq? @func "require"))
+"""
+
+# One query matching every node structure extraction cares about. The C
+# query matcher walks the tree instead of Python recursion, so extraction
+# iterates only matched nodes rather than every node in the file.
+_STRUCTURE_QUERY_SRC = """
+    (function_declaration name: (_)) @fn
+    (method_definition name: (_)) @method
+    (arrow_function) @arrow
+    (class_declaration name: (_)) @cls
+    (interface_declaration name: (_)) @iface
+    (type_alias_declaration name: (_)) @type
+    (enum_declaration name: (_)) @enum
+    (import_statement source: (string) @import_src)
+    (export_statement) @export
+"""
+
+
+class TypeScriptParser(LanguageParser):
+    """Parser for TypeScript files using tree-sitter with lazy initialization."""
+
+    # Parsed trees are kept around because the analyzer pipeline calls
+    # extract_dependencies and extract_code_structure for the same file;
+    # without the cache each file is read and parsed twice.
+    _TREE_CACHE_MAX = 128
+
+    def __init__(self):
+        self._language = None
+        self._parser = None
+        self._init_error = None
+        self._tree_cache: OrderedDict[tuple[str, int, int], tuple[bytes, Any]] = OrderedDict()
+
+    def _ensure_initialized(self) -> bool:
+        """Lazy initialization of tree-sitter components.
+
+        The grammar and import query are loaded once per process into
+        module-level singletons; instances just mirror them so callers
+        (and tests) can keep inspecting ``self._parser``/``self._language``.
+        """
+        global _LANG, _PARSER, _IMPORT_QUERY
+
+        if self._parser is not None:
+            return True
+        if self._init_error is not None:
+            return False
+
+        try:
+            with _INIT_LOCK:
+                if _PARSER is None:
+                    from tree_sitter import Query
+                    from tree_sitter_language_pack import get_language, get_parser
+                    _LANG = get_language('typescript')
+                    _PARSER = get_parser('typescript')
+                    _IMPORT_QUERY = Query(_LANG, _IMPORT_QUERY_SRC)
+            self._language = _LANG
+            self._parser = _PARSER
+            return True
+        except Exception as e:
+            self._init_error = e
+            logger.warning(f"Failed to initialize tree-sitter for TypeScript: {e}")
+            return False
+
+    def extract_dependencies(self, file_path: Path, repo_path: Path) -> list[str]:
+        """Extract TypeScript dependencies using tree-sitter."""
+        if not self._ensure_initialized():
+            logger.warning(f"Cannot extract dependencies from {file_path}: tree-sitter not available")
+            return []
+
+        dependencies = []
+
+        try:
+            content, tree = self._parse_cached(file_path)
+
+            # Use QueryCursor for new tree-sitter API (0.25.x+); the import
+            # query itself is precompiled at module scope
+            cursor = QueryCursor(_IMPORT_QUERY)
+            captures_dict = cursor.captures(tree.root_node)
+
+            # Convert dict format to old (node, name) tuple format for compatibility
+            captures = []
+            for capture_name, nodes in captures_dict.items():
+                for node in nodes:
+                    captures.append((node, capture_name))
+
+            for node, capture_name in captures:
+                if capture_name in ('import', 'require'):
+                    import_path = node.text.decode('utf-8').strip('"\'')
+
+                    # Skip external modules
+                    if not import_path.startswith('.') and not import_path.startswith('/'):
+                        continue
+
+                    deps = self._resolve_import_path(import_path, file_path, repo_path)
+                    dependencies.extend(deps)
+
+        except Exception as e:
+            logger.warning(f"Failed to parse TypeScript file {file_path}: {e}")
+
+        return dependencies
+
+    def extract_code_structure(self, file_path: Path, repo_path: Path) -> tuple[
+        list[CodeSymbol],
+        list[APIExport],
+        list[FunctionDependency],
+        list[str],  # imports
+        dict[str, Any]  # metadata
+    ]:
+        """Extract detailed code structure from TypeScript file.
+
+        Returns:
+            Tuple of (symbols, exports, function_deps, imports, metadata)
+        """
+        if not self._ensure_initialized():
+            logger.warning(f"Cannot extract code structure from {file_path}: tree-sitter not available")
+            return [], [], [], [], {}
+
+        try:
+            # Read bytes once; tree-sitter parses bytes and node.text is
+            # bytes, so nothing needs a full-file decode
+            content, tree = self._parse_cached(file_path)
+
+            # One compiled query matches everything of interest; Python then
+            # touches only the captured nodes
+            captures = QueryCursor(self._get_structure_query()).captures(tree.root_node)
+            symbols, imports, metadata = self._extract_from_captures(
+                captures, str(file_path)
+            )
+            metadata['lines_of_code'] = len(_NON_BLANK.findall(content))
+
+            # Extract exports
+            exports = self._extract_api_exports(symbols)
+
+            # Sort for determinism (symbols come back sorted already)
+            exports = sorted(exports, key=lambda e: e.name)
+            imports = sorted(imports)
+
+            return symbols, exports, [], imports, metadata
+
+        except Exception as e:
+            logger.warning(f"Failed to extract code structure from {file_path}: {e}")
+            return [], [], [], [], {}
+
+    def parse_files(self, files: list[tuple[Path, Path]]) -> list[tuple]:
+        """Extract code structure from many files concurrently.
+
+        ``Parser.parse`` and ``Query.captures`` run in native C and
+        release the GIL, so fanning per-file extraction across threads
+        scales close to linearly with core count. Results come back in
+        the same order as ``files``; extraction keeps no per-file state
+        on the instance, so workers don't interfere.
+
+        Args:
+            files: (file_path, repo_path) pairs to analyze
+
+        Returns:
+            One extract_code_structure result tuple per input pair
+        """
+        if not files:
+            return []
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(
+                executor.map(lambda pair: self.extract_code_structure(*pair), files)
+            )
+
+    def _parse_cached(self, file_path: Path) -> tuple:
+        """Return (content bytes, parsed tree), reusing a recent parse.
+
+        Keyed by (path, mtime_ns, size) with LRU eviction, so an edited
+        file re-parses while the cache stays bounded at
+        :attr:`_TREE_CACHE_MAX` entries.
+        """
+        st = os.stat(file_path)
+        key = (str(file_path), st.st_mtime_ns, st.st_size)
+        cached = self._tree_cache.get(key)
+        if cached is not None:
+            self._tree_cache.move_to_end(key)
+            return cached
+        content = file_path.read_bytes()
+        tree = self._parser.parse(content)
+        self._tree_cache[key] = (content, tree)
+        if len(self._tree_cache) > self._TREE_CACHE_MAX:
+            self._tree_cache.popitem(last=False)
+        return content, tree
+
+    _structure_query = None
+
+    def _get_structure_query(self):
+        """Compile the structure query once per process and reuse it."""
+        cls = type(self)
+        if cls._structure_query is None:
+            from tree_sitter import Query
+            cls._structure_query = Query(self._language, _STRUCTURE_QUERY_SRC)
+        return cls._structure_query
+
+    def _extract_from_captures(self, captures: dict[str, list],
+                              file_path_str: str) -> tuple[
+        list[CodeSymbol], list[str], dict[str, Any]
+    ]:
+        """Build symbols, imports and counts from captures.
+
+        Symbols accumulate as plain tuples on the hot path; CodeSymbol
+        objects are materialized once, after sorting, so the per-node
+        loop allocates rows instead of dataclass instances.
+        """
+        imports: list[str] = []
+
+        fn_nodes = captures.get('fn', [])
+        method_nodes = captures.get('method', [])
+        cls_nodes = captures.get('cls', [])
+        iface_nodes = captures.get('iface', [])
+        type_nodes = captures.get('type', [])
+        enum_nodes = captures.get('enum', [])
+
+        metadata: dict[str, Any] = {
+            'total_functions': (len(fn_nodes) + len(method_nodes)
+                                + len(captures.get('arrow', []))),
+            'total_classes': len(cls_nodes),
+            'total_interfaces': len(iface_nodes),
+            'total_types': len(type_nodes),
+            'total_enums': len(enum_nodes),
+        }
+
+        # Names of function/method/class anchors, keyed by node id, so a
+        # nested symbol can find its nearest enclosing named scope
+        anchor_name: dict[int, str] = {}
+        for anchor in (*fn_nodes, *method_nodes, *cls_nodes):
+            name_node = anchor.child_by_field_name('name')
+            if name_node:
+                anchor_name[anchor.id] = name_node.text.decode('utf-8')
+
+        def nearest_parent(node):
+            parent = node.parent
+            while parent is not None:
+                name = anchor_name.get(parent.id)
+                if name is not None:
+                    return name
+                parent = parent.parent
+            return None
+
+        # Export statements are already captured; merge their byte spans
+        # into disjoint sorted intervals so "is this node under an export
+        # statement" becomes one bisect instead of an upward parent walk
+        # per symbol. Tree-sitter spans nest, so span containment is
+        # exactly the ancestor relation the old walk checked.
+        export_starts: list[int] = []
+        export_ends: list[int] = []
+        for start, end in sorted(
+            (n.start_byte, n.end_byte) for n in captures.get('export', [])
+        ):
+            if export_ends and start <= export_ends[-1]:
+                if end > export_ends[-1]:
+                    export_ends[-1] = end
+            else:
+                export_starts.append(start)
+                export_ends.append(end)
+
+        def is_exported(node) -> bool:
+            i = bisect_right(export_starts, node.start_byte) - 1
+            return i >= 0 and node.end_byte <= export_ends[i]
+
+        # Row layout: (line_start, symbol_type, name, line_end, signature,
+        # is_exported, is_private, parent) - the prefix doubles as the
+        # determinism sort key
+        rows: list[tuple] = []
+        add_row = rows.append
+
+        for node in (*fn_nodes, *method_nodes):
+            try:
+                name_node = node.child_by_field_name('name')
+                if not name_node:
+                    continue
+                name = name_node.text.decode('utf-8')
+                add_row((
+                    node.start_point[0] + 1, 'function', name,
+                    node.end_point[0] + 1,
+                    node.text.split(b'\n', 1)[0][:200].decode('utf-8', 'replace'),
+                    is_exported(node), name.startswith('_'),
+                    nearest_parent(node),
+                ))
+            except Exception as e:
+                logger.debug(f"Failed to extract function symbol: {e}")
+
+        for nodes, kind in (
+            (cls_nodes, 'class'),
+            (iface_nodes, 'interface'),
+            (type_nodes, 'type'),
+            (enum_nodes, 'enum'),
+        ):
+            for node in nodes:
+                try:
+                    name_node = node.child_by_field_name('name')
+                    if not name_node:
+                        continue
+                    name = name_node.text.decode('utf-8')
+                    add_row((
+                        node.start_point[0] + 1, kind, name,
+                        node.end_point[0] + 1,
+                        f"{kind} {name}",
+                        is_exported(node),
+                        name.startswith('_') if kind == 'class' else False,
+                        None,
+                    ))
+                except Exception as e:
+                    logger.debug(f"Failed to extract {kind} symbol: {e}")
+
+        rows.sort(key=lambda row: row[:3])
+        # Hash the (often long) file path once per file: each symbol ID
+        # starts from a cheap copy of this pre-seeded hasher state
+        base_hasher = hashlib.sha256(file_path_str.encode('utf-8') + b':')
+        generate_id = self._generate_symbol_id
+        symbols = [
+            CodeSymbol(
+                name=name,
+                symbol_type=kind,
+                line_start=start,
+                line_end=end,
+                signature=signature,
+                is_exported=exported,
+                is_private=private,
+                parent=parent,
+                id=generate_id(base_hasher, kind, name, start),
+            )
+            for start, kind, name, end, signature, exported, private, parent in rows
+        ]
+
+        for node in captures.get('import_src', []):
+            source = node.text.decode('utf-8').strip('"\'')
+            imports.append(f"import ... from '{source}'")
+
+        return symbols, imports, metadata
+
+    def _extract_api_exports(self, symbols: list[CodeSymbol]) -> list[APIExport]:
+        """Build APIExports for the symbols flagged as exported."""
+        return [
+            APIExport(
+                name=symbol.name,
+                export_type=symbol.symbol_type,
+                symbol_id=symbol.id,
+            )
+            for symbol in symbols
+            if symbol.is_exported
+        ]
+
+    def _generate_symbol_id(self, base_hasher, kind: str, name: str, line: int) -> UUID:
+        """Generate deterministic symbol ID using SHA256.
+
+        *base_hasher* arrives pre-seeded with ``{file_path}:`` so the
+        path bytes are hashed once per file; copying hasher state is
+        nearly free. Digests match the previous
+        ``{file_path}:{kind}:{name}:{line}`` string form exactly.
+        """
+        hasher = base_hasher.copy()
+        hasher.update(b'%b:%b:%d' % (_KIND_BYTES[kind], name.encode('utf-8'), line))
+        return UUID(bytes=hasher.digest()[:16])
+
+    def _resolve_import_path(self, import_path: str, file_path: Path, repo_path: Path) -> list[str]:
+        """Resolve TypeScript import path."""
+        resolved_paths = []
+
+        if import_path.startswith('./') or import_path.startswith('../'):
+            # Relative import
+            base_dir = file_path.parent
+            target_path = (base_dir / import_path).resolve()
+        elif import_path.startswith('/'):
+            # Absolute import from repo root
+            target_path = repo_path / import_path[1:]
+        else:
+            # Module import
+            return []
+
+        # Try different extensions
+        extensions = self._get_file_extensions()
+        for ext in extensions:
+            candidate = target_path.with_suffix(ext)
+            if candidate.exists() and candidate.is_file():
+                try:
+                    rel_path = candidate.relative_to(repo_path)
+                    resolved_paths.append(str(rel_path))
+                except ValueError:
+                    pass
+
+        # Try directory with index file
+        if target_path.is_dir():
+            for index_name in self._get_init_files():
+                index_file = target_path / index_name
+                if index_file.exists():
+                    try:
+                        rel_path = index_file.relative_to(repo_path)
+                        resolved_paths.append(str(rel_path))
+                    except ValueError:
+                        pass
+
+        return resolved_paths
+
+    def _get_file_extensions(self) -> list[str]:
+        """Get TypeScript file extensions."""
+        return ['.ts', '.tsx', '.js', '.jsx']
+
+    def _get_init_files(self) -> list[str]:
+        """Get TypeScript initialization files."""
+        return ['index.ts', 'index.tsx', 'index.js', 'index.jsx']
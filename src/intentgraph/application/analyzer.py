@@ -63,11 +63,17 @@ class RepositoryAnalyzer:
         )
         self.analysis_service = CodeAnalysisService(
             self.parser_factory,
-            self.file_repository
+            self.file_repository,
+            workers=self.workers,
         )
         self.graph_service = DependencyGraphService(self.parser_factory)
         self.summary_service = LanguageSummaryService(self.file_repository)
 
+        # Warm parsers off the critical path so the first analyzed file of
+        # each language doesn't pay tree-sitter library load latency
+        from ..adapters.parsers import warm_up_parsers
+        warm_up_parsers(self.language_filter)
+
     def analyze(self, repo_path: Path) -> AnalysisResult:
         """Analyze a repository and return results."""
         if not repo_path.exists():
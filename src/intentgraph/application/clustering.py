@@ -127,7 +127,7 @@ class ClusteringEngine:
         cluster_count = 1
         
         # Sort files by size (largest first) for better packing
-        sorted_files = sorted(analysis.files, key=lambda f: f.loc, reverse=True)
+        sorted_files = sorted(analysis.files, key=attrgetter("loc"), reverse=True)
         
         for file_info in sorted_files:
             # Estimate file size in KB (rough: LOC * 50 bytes per line)
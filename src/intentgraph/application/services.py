@@ -79,17 +79,48 @@ class FileDiscoveryService:
         )
 
 
+# Per-process service reused across tasks so each worker warms its parsers once
+_worker_service: Optional["CodeAnalysisService"] = None
+
+
+def _analyze_file_worker(file_path: Path, repo_path: Path) -> Optional[FileInfo]:
+    """Analyze one file inside a worker process."""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = CodeAnalysisService()
+    return _worker_service._analyze_single_file(file_path, repo_path)
+
+
 class CodeAnalysisService:
     """Service for analyzing individual files and extracting metadata."""
-    
-    def __init__(self, parser_factory=None, file_repository=None):
+
+    # Below this file count the process pool startup cost outweighs the win
+    _PARALLEL_THRESHOLD = 16
+
+    def __init__(self, parser_factory=None, file_repository=None, workers: int = 1):
         self.parser_factory = parser_factory
         self.file_repository = file_repository
-    
+        self.workers = max(1, workers)
+
     def analyze_files(self, files: list[Path], repo_path: Path) -> list[FileInfo]:
-        """Analyze files to extract metadata."""
+        """Analyze files to extract metadata.
+
+        AST parsing is CPU-bound, so large batches are fanned out to a
+        process pool. Files are submitted largest-first so one worker
+        doesn't end up with all the big files at the tail.
+        """
+        if self.workers > 1 and len(files) >= self._PARALLEL_THRESHOLD:
+            try:
+                return self._analyze_files_parallel(files, repo_path)
+            except (OSError, RuntimeError) as e:
+                # Pool startup/teardown failures only (BrokenProcessPool is a
+                # RuntimeError; restricted environments raise OSError when
+                # spawning workers). Per-file parse errors are handled inside
+                # _analyze_files_parallel and must not trigger a full re-run.
+                logger.warning(f"Parallel analysis failed, falling back to serial: {e}")
+
         file_infos = []
-        
+
         for file_path in files:
             try:
                 file_info = self._analyze_single_file(file_path, repo_path)
@@ -97,8 +128,37 @@ class CodeAnalysisService:
                     file_infos.append(file_info)
             except Exception as e:
                 logger.warning(f"Failed to analyze {file_path}: {e}")
-                
+
         return file_infos
+
+    def _analyze_files_parallel(self, files: list[Path], repo_path: Path) -> list[FileInfo]:
+        """Analyze files across a process pool, preserving input order."""
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        def _size(path: Path) -> int:
+            try:
+                return path.stat().st_size
+            except OSError:
+                return 0
+
+        ordered = sorted(files, key=_size, reverse=True)
+        results: dict[Path, FileInfo] = {}
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(ordered))) as executor:
+            futures = {
+                executor.submit(_analyze_file_worker, file_path, repo_path): file_path
+                for file_path in ordered
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    file_info = future.result()
+                    if file_info:
+                        results[file_path] = file_info
+                except Exception as e:
+                    logger.warning(f"Failed to analyze {file_path}: {e}")
+
+        return [results[file_path] for file_path in files if file_path in results]
     
     def _analyze_single_file(self, file_path: Path, repo_path: Path) -> Optional[FileInfo]:
         """Analyze a single file with enhanced structure analysis."""
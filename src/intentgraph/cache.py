@@ -4,15 +4,35 @@ SPEC-IG-QUERY-0001, T-01.
 """
 
 import hashlib
-import json
+import mmap
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import orjson
+
 from .application.analyzer import RepositoryAnalyzer
 from .domain.models import AnalysisResult
 
-_SCHEMA_VERSION = "1"
+_SCHEMA_VERSION = "2"
+
+# Older schemas we can still read. A v1 cache has no stat map, so staleness
+# falls back to hashing every file; v2 adds the mtime/size fast path.
+_READABLE_SCHEMA_VERSIONS = ("1", _SCHEMA_VERSION)
+
+
+def _hash_file(path: Path) -> str:
+    """Stream *path* through SHA-256 in 1 MiB chunks.
+
+    Keeps peak memory constant regardless of file size — large generated
+    files would otherwise be loaded whole, once per hashing thread.
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb", buffering=0) as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
 
 
 class CacheManager:
@@ -30,6 +50,10 @@ class CacheManager:
     def __init__(self, repo_path: Path) -> None:
         self._repo_path: Path = repo_path
         self._cache_path: Path = repo_path / ".intentgraph" / "cache.json"
+        # (cache-file mtime_ns, staleness entries, stat map, result) from
+        # the last successful load - repeat loads in one process skip the
+        # decode and model validation entirely.
+        self._memo: tuple[int, list[tuple[str, str]], dict | None, AnalysisResult] | None = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -44,22 +68,38 @@ class CacheManager:
         - any tracked file has a different SHA-256 digest on disk, or
         - any tracked file no longer exists on disk.
         """
-        if not self._cache_path.exists():
+        try:
+            cache_mtime_ns = os.stat(self._cache_path).st_mtime_ns
+        except OSError:
             return None
 
+        # Unchanged cache file already loaded this process: only the
+        # (stat fast path) staleness check needs to re-run.
+        memo = self._memo
+        if memo is not None and memo[0] == cache_mtime_ns:
+            _, entries, stat_map, result = memo
+            if self._is_stale(entries, stat_map):
+                return None
+            return result
+
+        # Staleness runs against the raw decoded dict first: validating
+        # the full AnalysisResult is the dominant cost of a load, and on
+        # a stale cache that work would be thrown away.
         try:
-            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
-            if data.get("schema_version") != "1":
+            data = self._read_payload()
+            if data.get("schema_version") not in _READABLE_SCHEMA_VERSIONS:
+                return None
+            entries = [
+                (f["path"], f["sha256"]) for f in data["result"]["files"]
+            ]
+            if self._is_stale(entries, data.get("stat")):
                 return None
             result = AnalysisResult.model_validate(data["result"])
+            self._memo = (cache_mtime_ns, entries, data.get("stat"), result)
+            return result
         except Exception:
             return None
 
-        if self._is_stale(result):
-            return None
-
-        return result
-
     def save(self, result: AnalysisResult) -> None:
         """Persist *result* to the cache file atomically.
 
@@ -72,17 +112,32 @@ class CacheManager:
         """
         cache_dir = self._cache_path.parent
         cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memo = None
+
+        # Record (mtime_ns, size) per tracked file so staleness checks can
+        # skip hashing files whose stat has not moved.
+        stat_map: dict[str, list[int]] = {}
+        for file_info in result.files:
+            try:
+                st = os.stat(self._repo_path / file_info.path)
+            except OSError:
+                continue
+            stat_map[str(file_info.path)] = [st.st_mtime_ns, st.st_size]
 
         payload = {
             "schema_version": _SCHEMA_VERSION,
+            "stat": stat_map,
             "result": result.model_dump(mode="json"),
         }
-        serialised = json.dumps(payload, indent=2)
+        # Compact (un-indented) output: the cache is machine-read only, and
+        # dropping the indentation whitespace shrinks multi-MB caches
+        # substantially, which also speeds up every subsequent load.
+        serialised = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
 
         # Write to a sibling temp file then rename — atomic on POSIX.
         fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            with os.fdopen(fd, "wb") as fh:
                 fh.write(serialised)
             os.replace(tmp_path, self._cache_path)
         except Exception:
@@ -98,6 +153,7 @@ class CacheManager:
 
         Calling this method when no cache file is present is a no-op.
         """
+        self._memo = None
         try:
             self._cache_path.unlink()
         except FileNotFoundError:
@@ -125,13 +181,17 @@ class CacheManager:
 
         if exists:
             try:
-                data = json.loads(self._cache_path.read_text(encoding="utf-8"))
-                if data.get("schema_version") != _SCHEMA_VERSION:
+                data = self._read_payload()
+                if data.get("schema_version") not in _READABLE_SCHEMA_VERSIONS:
                     stale = True
                 else:
-                    result = AnalysisResult.model_validate(data["result"])
-                    file_count = len(result.files)
-                    stale = self._is_stale(result)
+                    # The summary only needs path/sha256 pairs - no
+                    # AnalysisResult reconstruction at all.
+                    entries = [
+                        (f["path"], f["sha256"]) for f in data["result"]["files"]
+                    ]
+                    file_count = len(entries)
+                    stale = self._is_stale(entries, data.get("stat"))
             except Exception:
                 stale = True
 
@@ -166,13 +226,88 @@ class CacheManager:
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _is_stale(self, result: AnalysisResult) -> bool:
-        """Return ``True`` if any tracked file has changed or is missing."""
-        for file_info in result.files:
-            full_path = self._repo_path / file_info.path
-            if not full_path.exists():
+    def _read_payload(self) -> dict:
+        """Decode the cache file via ``mmap`` rather than a full read.
+
+        Mapping lets the kernel page the file in on demand and avoids
+        materializing a second multi-MB bytes copy alongside the parsed
+        structure. Zero-length or unmappable files fall back to a plain
+        read.
+        """
+        with open(self._cache_path, "rb") as fh:
+            try:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                return orjson.loads(fh.read())
+            try:
+                return orjson.loads(memoryview(mm))
+            finally:
+                mm.close()
+
+    def _is_stale(
+        self, entries: list[tuple[str, str]], stat_map: dict[str, list[int]] | None = None
+    ) -> bool:
+        """Return ``True`` if any tracked file has changed or is missing.
+
+        *entries* are ``(relative_path, sha256)`` pairs taken straight
+        from the decoded cache payload, so staleness never requires a
+        validated model.
+
+        When *stat_map* (recorded at save time) is available, a file whose
+        ``(mtime_ns, size)`` still matches is accepted without hashing —
+        stat is O(1) per file where hashing is O(bytes), so the common
+        "nothing changed" check avoids reading the repository entirely.
+        Files whose stat differs still fall back to the SHA-256 comparison,
+        so a rewrite with identical content does not invalidate the cache.
+
+        Hash fallbacks run across a thread pool: ``hashlib`` releases the
+        GIL while digesting, so hashing many files scales with cores, and
+        the check short-circuits on the first mismatch.
+        """
+        if stat_map:
+            # Recently modified files are the likeliest to have changed;
+            # checking them first (and hashing them first on fallback) makes
+            # the short-circuit fire after O(changed) files, not O(all).
+            entries = sorted(
+                entries,
+                key=lambda entry: stat_map.get(entry[0], (0, 0))[0],
+                reverse=True,
+            )
+
+        to_hash: list[tuple[Path, str]] = []
+        for rel_path, expected_digest in entries:
+            full_path = self._repo_path / rel_path
+            try:
+                st = os.stat(full_path)
+            except OSError:
                 return True
-            current_digest = hashlib.sha256(full_path.read_bytes()).hexdigest()
-            if current_digest != file_info.sha256:
+            if stat_map is not None:
+                recorded = stat_map.get(rel_path)
+                if recorded == [st.st_mtime_ns, st.st_size]:
+                    continue
+            to_hash.append((full_path, expected_digest))
+
+        if not to_hash:
+            return False
+
+        def changed(item: tuple[Path, str]) -> bool:
+            path, expected = item
+            try:
+                return _hash_file(path) != expected
+            except OSError:
                 return True
-        return False
+
+        if len(to_hash) == 1:
+            return changed(to_hash[0])
+
+        stale = False
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(changed, item) for item in to_hash]
+            for future in as_completed(futures):
+                if future.result():
+                    stale = True
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        return stale
@@ -34,7 +34,7 @@ class Language(str, Enum):
         return ext_map.get(extension.lower(), cls.UNKNOWN)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CodeSymbol:
     """Represents a function, class, or other code symbol.
     
@@ -80,7 +80,7 @@ class CodeSymbol:
     id: UUID = field(default_factory=uuid4)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionDependency:
     """Represents a specific function-level dependency."""
     
@@ -92,7 +92,7 @@ class FunctionDependency:
     context: Optional[str] = field(default=None)  # Code context around dependency
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class APIExport:
     """Represents something exported by a module."""
     
@@ -104,7 +104,7 @@ class APIExport:
     docstring: Optional[str] = field(default=None)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileInfo:
     """Information about a source file."""
 
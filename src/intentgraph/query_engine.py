@@ -8,7 +8,6 @@ This module MUST NOT import from intentgraph.ai.
 from __future__ import annotations
 
 import re
-from collections import deque
 from uuid import UUID
 
 from intentgraph.domain.models import AnalysisResult, CodeSymbol, FileInfo
@@ -32,6 +31,14 @@ class QueryEngine:
         # Index: file UUID -> list of file UUIDs that declare it as a dependency
         self._reverse_deps: dict[UUID, list[UUID]] = {}
 
+        # Index: file UUID -> frozenset of symbol names declared in the file
+        self._symbol_names_by_file: dict[UUID, frozenset[str]] = {}
+
+        # Index: target symbol UUID -> caller records in discovery order.
+        # Records are (sequence, row) so lookups over several same-named
+        # symbols can be merged back into the original scan order.
+        self._callers_by_sym: dict[UUID, list[tuple[int, dict[str, object]]]] = {}
+
         self._build_indices()
 
     # ------------------------------------------------------------------
@@ -39,16 +46,54 @@ class QueryEngine:
     # ------------------------------------------------------------------
 
     def _build_indices(self) -> None:
-        for fi in self._result.files:
+        files = self._result.files
+        # Path strings are rendered once here; PosixPath.__str__ rebuilds
+        # the string from its parts on every call, and every query method
+        # puts the path in its output rows.
+        self._path_str: list[str] = []
+        for fi in files:
+            path_str = str(fi.path)
+            self._path_str.append(path_str)
             self._file_by_id[fi.id] = fi
-            self._file_by_path[str(fi.path)] = fi
+            self._file_by_path[path_str] = fi
 
             for sym in fi.symbols:
                 self._symbol_by_name.setdefault(sym.name, []).append((fi, sym))
+            self._symbol_names_by_file[fi.id] = frozenset(
+                sym.name for sym in fi.symbols
+            )
 
-        for fi in self._result.files:
+        seq = 0
+        for i, fi in enumerate(files):
             for dep_id in fi.dependencies:
                 self._reverse_deps.setdefault(dep_id, []).append(fi.id)
+            path_str = self._path_str[i]
+            for fd in fi.function_dependencies:
+                self._callers_by_sym.setdefault(fd.to_symbol, []).append((
+                    seq,
+                    {
+                        "file": path_str,
+                        "line": fd.line_number,
+                        "context": fd.context,
+                    },
+                ))
+                seq += 1
+
+        # Dense int-indexed adjacency for the graph queries: hashing a
+        # UUID goes through its 128-bit int on every dict probe, whereas
+        # list indexing with small ints is a direct slot load. The
+        # UUID-keyed maps above stay as the lookup boundary.
+        index_of = {fi.id: i for i, fi in enumerate(files)}
+        self._files: list[FileInfo] = list(files)
+        self._index_of: dict[UUID, int] = index_of
+        self._deps_adj: list[list[int]] = [
+            [index_of[dep_id] for dep_id in fi.dependencies if dep_id in index_of]
+            for fi in files
+        ]
+        self._rdeps_adj: list[list[int]] = [[] for _ in files]
+        for i, adj in enumerate(self._deps_adj):
+            for j in adj:
+                self._rdeps_adj[j].append(i)
 
     # ------------------------------------------------------------------
     # Query methods
@@ -63,20 +108,25 @@ class QueryEngine:
         and will be silently omitted. This is a constraint of the domain model,
         not a bug.
         """
-        # Collect target symbol UUIDs for this name
-        target_sym_ids: set[UUID] = set()
-        for fi, sym in self._symbol_by_name.get(symbol_name, []):
-            target_sym_ids.add(sym.id)
+        # Collect target symbol UUIDs for this name, then gather their
+        # precomputed caller records - O(matches) instead of rescanning
+        # every file's function_dependencies per call.
+        target_sym_ids = {
+            sym.id for _, sym in self._symbol_by_name.get(symbol_name, [])
+        }
 
-        callers_list = []
-        for fi in self._result.files:
-            for fd in fi.function_dependencies:
-                if fd.to_symbol in target_sym_ids:
-                    callers_list.append({
-                        "file": str(fi.path),
-                        "line": fd.line_number,
-                        "context": fd.context,
-                    })
+        if len(target_sym_ids) == 1:
+            entries = self._callers_by_sym.get(next(iter(target_sym_ids)), [])
+        else:
+            # Sequence numbers restore the original scan order when the
+            # name maps to several symbols. Unique, so ties never compare
+            # the row dicts.
+            entries = sorted(
+                entry
+                for sym_id in target_sym_ids
+                for entry in self._callers_by_sym.get(sym_id, ())
+            )
+        callers_list = [row for _, row in entries]
 
         return {"symbol": symbol_name, "callers": callers_list}
 
@@ -86,15 +136,14 @@ class QueryEngine:
         if fi is None:
             return {"file": file_path, "dependents": []}
 
-        dependent_ids = self._reverse_deps.get(fi.id, [])
-        result_list = []
-        for dep_id in dependent_ids:
-            dep_fi = self._file_by_id.get(dep_id)
-            if dep_fi is not None:
-                result_list.append({
-                    "file": str(dep_fi.path),
-                    "dependency_type": "file-level",
-                })
+        path_str = self._path_str
+        result_list = [
+            {
+                "file": path_str[i],
+                "dependency_type": "file-level",
+            }
+            for i in self._rdeps_adj[self._index_of[fi.id]]
+        ]
 
         return {"file": file_path, "dependents": result_list}
 
@@ -104,14 +153,14 @@ class QueryEngine:
         if fi is None:
             return {"file": file_path, "deps": []}
 
-        result_list = []
-        for dep_id in fi.dependencies:
-            dep_fi = self._file_by_id.get(dep_id)
-            if dep_fi is not None:
-                result_list.append({
-                    "file": str(dep_fi.path),
-                    "dependency_type": "file-level",
-                })
+        path_str = self._path_str
+        result_list = [
+            {
+                "file": path_str[i],
+                "dependency_type": "file-level",
+            }
+            for i in self._deps_adj[self._index_of[fi.id]]
+        ]
 
         return {"file": file_path, "deps": result_list}
 
@@ -155,19 +204,35 @@ class QueryEngine:
             "has_symbol": has_symbol,
         }
 
+        # Compile the name pattern once per call instead of once per file;
+        # a pattern with no regex metacharacters degrades to a plain
+        # substring test, which skips the regex engine entirely.
+        compiled: re.Pattern[str] | None = None
+        literal: str | None = None
+        if name_pattern is not None:
+            if re.escape(name_pattern) == name_pattern:
+                literal = name_pattern
+            else:
+                compiled = re.compile(name_pattern)
+
         results = []
-        for fi in self._result.files:
-            if not _passes_name_pattern(fi, name_pattern):
+        for fi, path_str in zip(self._files, self._path_str):
+            if literal is not None and literal not in path_str:
+                continue
+            if compiled is not None and compiled.search(path_str) is None:
                 continue
             if not _passes_lang(fi, lang):
                 continue
-            if not _passes_has_symbol(fi, has_symbol):
+            if (
+                has_symbol is not None
+                and has_symbol not in self._symbol_names_by_file[fi.id]
+            ):
                 continue
             if not _passes_complexity(fi, complexity_gt):
                 continue
 
             results.append({
-                "file": str(fi.path),
+                "file": path_str,
                 "language": fi.language.value,
                 "loc": fi.loc,
                 "symbol_count": len(fi.symbols),
@@ -190,34 +255,71 @@ class QueryEngine:
         if fi_a is None or fi_b is None:
             return {"from": file_a, "to": file_b, "path": [], "found": False}
 
-        # BFS over forward dependency graph: fi -> fi.dependencies
-        # predecessor map: UUID -> UUID | None (how we reached this node)
-        predecessors: dict[UUID, UUID | None] = {fi_a.id: None}
-        queue: deque[UUID] = deque([fi_a.id])
-        found = False
-
-        while queue and not found:
-            current_id = queue.popleft()
-            current_fi = self._file_by_id[current_id]
-            for dep_id in current_fi.dependencies:
-                if dep_id not in self._file_by_id:  # guard first
-                    continue
-                if dep_id not in predecessors:
-                    predecessors[dep_id] = current_id
-                    if dep_id == fi_b.id:  # early exit second
-                        found = True
+        # Bidirectional BFS over the int-indexed adjacency: forward over
+        # _deps_adj from file_a, backward over _rdeps_adj from file_b.
+        # Each step expands the smaller frontier one full level, so the
+        # searches meet in the middle after exploring O(2 * b^(d/2)) nodes
+        # instead of O(b^d). Flat parent arrays replace dict-based visited
+        # sets (-2 = unvisited, -1 = search root: a single int compare per
+        # probe), and level expansion swaps plain lists instead of cycling
+        # a deque.
+        deps_adj = self._deps_adj
+        rdeps_adj = self._rdeps_adj
+        src_idx = self._index_of[fi_a.id]
+        dst_idx = self._index_of[fi_b.id]
+        n = len(deps_adj)
+        fwd_parents = [-2] * n
+        bwd_parents = [-2] * n
+        fwd_parents[src_idx] = -1
+        bwd_parents[dst_idx] = -1
+        fwd_frontier = [src_idx]
+        bwd_frontier = [dst_idx]
+        meet = -1
+
+        while fwd_frontier and bwd_frontier and meet < 0:
+            if len(fwd_frontier) <= len(bwd_frontier):
+                next_frontier: list[int] = []
+                for current in fwd_frontier:
+                    for dep in deps_adj[current]:
+                        if fwd_parents[dep] != -2:
+                            continue
+                        fwd_parents[dep] = current
+                        if bwd_parents[dep] != -2:
+                            meet = dep
+                            break
+                        next_frontier.append(dep)
+                    if meet >= 0:
+                        break
+                fwd_frontier = next_frontier
+            else:
+                next_frontier = []
+                for current in bwd_frontier:
+                    for pred in rdeps_adj[current]:
+                        if bwd_parents[pred] != -2:
+                            continue
+                        bwd_parents[pred] = current
+                        if fwd_parents[pred] != -2:
+                            meet = pred
+                            break
+                        next_frontier.append(pred)
+                    if meet >= 0:
                         break
-                    queue.append(dep_id)
-
-        if found:
-            # Reconstruct path
-            path_ids = []
-            node: UUID | None = fi_b.id
-            while node is not None:
-                path_ids.append(node)
-                node = predecessors[node]
-            path_ids.reverse()
-            path_strs = [str(self._file_by_id[n].path) for n in path_ids]
+                bwd_frontier = next_frontier
+
+        if meet >= 0:
+            # Stitch the two predecessor chains at the meeting node.
+            path_idxs = []
+            node = meet
+            while node >= 0:
+                path_idxs.append(node)
+                node = fwd_parents[node]
+            path_idxs.reverse()
+            node = bwd_parents[meet]
+            while node >= 0:
+                path_idxs.append(node)
+                node = bwd_parents[node]
+            path_str = self._path_str
+            path_strs = [path_str[n] for n in path_idxs]
             return {"from": file_a, "to": file_b, "path": path_strs, "found": True}
 
         return {"from": file_a, "to": file_b, "path": [], "found": False}
@@ -250,24 +352,12 @@ def _symbol_to_dict(sym: CodeSymbol) -> dict[str, object]:
     }
 
 
-def _passes_name_pattern(fi: FileInfo, name_pattern: str | None) -> bool:
-    if name_pattern is None:
-        return True
-    return bool(re.search(name_pattern, str(fi.path)))
-
-
 def _passes_lang(fi: FileInfo, lang: str | None) -> bool:
     if lang is None:
         return True
     return fi.language.value.lower() == lang.lower()
 
 
-def _passes_has_symbol(fi: FileInfo, has_symbol: str | None) -> bool:
-    if has_symbol is None:
-        return True
-    return any(sym.name == has_symbol for sym in fi.symbols)
-
-
 def _passes_complexity(fi: FileInfo, complexity_gt: int | None) -> bool:
     """Filter by complexity.
 
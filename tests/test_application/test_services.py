@@ -0,0 +1,100 @@
+"""Tests for application layer services."""
+
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+from intentgraph.application.services import CodeAnalysisService
+
+
+def _make_python_files(repo_path: Path, count: int) -> list[Path]:
+    """Write `count` small Python modules and return their paths."""
+    files = []
+    for i in range(count):
+        file_path = repo_path / f"module_{i:02d}.py"
+        file_path.write_text(
+            f"import os\n"
+            f"\n"
+            f"def func_{i}(x):\n"
+            f"    if x > {i}:\n"
+            f"        return x * {i}\n"
+            f"    return x\n"
+        )
+        files.append(file_path)
+    return files
+
+
+def _fingerprint(file_infos):
+    """Project FileInfo results onto their deterministic fields.
+
+    FileInfo ids are random per run, so serial and parallel results are
+    compared on content rather than identity.
+    """
+    return [
+        (
+            str(info.path),
+            info.sha256,
+            info.loc,
+            sorted(sym.name for sym in info.symbols),
+            sorted(info.imports),
+            info.complexity_score,
+        )
+        for info in file_infos
+    ]
+
+
+class TestCodeAnalysisServiceParallel:
+    """Tests for the process-pool path of CodeAnalysisService.analyze_files."""
+
+    def test_parallel_results_match_serial(self, tmp_path):
+        """The process-pool path produces the same results as the serial path."""
+        files = _make_python_files(tmp_path, CodeAnalysisService._PARALLEL_THRESHOLD)
+
+        serial = CodeAnalysisService(workers=1).analyze_files(files, tmp_path)
+        parallel = CodeAnalysisService(workers=2).analyze_files(files, tmp_path)
+
+        assert len(serial) == len(files)
+        assert _fingerprint(parallel) == _fingerprint(serial)
+
+    def test_parallel_path_taken_at_threshold(self, tmp_path):
+        """workers > 1 with >= threshold files routes through the process pool."""
+        files = _make_python_files(tmp_path, CodeAnalysisService._PARALLEL_THRESHOLD)
+        service = CodeAnalysisService(workers=2)
+
+        with patch.object(
+            service, "_analyze_files_parallel", wraps=service._analyze_files_parallel
+        ) as parallel_spy:
+            results = service.analyze_files(files, tmp_path)
+
+        parallel_spy.assert_called_once_with(files, tmp_path)
+        assert len(results) == len(files)
+
+    def test_serial_path_below_threshold(self, tmp_path):
+        """Small batches stay on the serial path even with workers > 1."""
+        files = _make_python_files(
+            tmp_path, CodeAnalysisService._PARALLEL_THRESHOLD - 1
+        )
+        service = CodeAnalysisService(workers=2)
+
+        with patch.object(service, "_analyze_files_parallel") as parallel_spy:
+            results = service.analyze_files(files, tmp_path)
+
+        parallel_spy.assert_not_called()
+        assert len(results) == len(files)
+
+    def test_pool_failure_falls_back_to_serial(self, tmp_path, caplog):
+        """A broken process pool falls back to serial analysis with a warning."""
+        files = _make_python_files(tmp_path, CodeAnalysisService._PARALLEL_THRESHOLD)
+        service = CodeAnalysisService(workers=2)
+
+        with patch.object(
+            service, "_analyze_files_parallel", side_effect=OSError("cannot spawn")
+        ):
+            with caplog.at_level(logging.WARNING):
+                results = service.analyze_files(files, tmp_path)
+
+        assert len(results) == len(files)
+        assert _fingerprint(results) == _fingerprint(
+            CodeAnalysisService(workers=1).analyze_files(files, tmp_path)
+        )
+        assert "falling back to serial" in caplog.text
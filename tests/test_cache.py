@@ -94,10 +94,20 @@ class TestSave:
         data = json.loads(manager._cache_path.read_text())  # noqa: SLF001
         assert isinstance(data, dict)
 
-    def test_save_json_has_schema_version_1(self, manager: CacheManager, result: AnalysisResult) -> None:
+    def test_save_json_has_schema_version_2(self, manager: CacheManager, result: AnalysisResult) -> None:
         manager.save(result)
         data = json.loads(manager._cache_path.read_text())  # noqa: SLF001
-        assert data["schema_version"] == "1"
+        assert data["schema_version"] == "2"
+
+    def test_save_records_stat_entry_per_file(
+        self, manager: CacheManager, result: AnalysisResult, py_file: tuple[Path, bytes]
+    ) -> None:
+        p, _ = py_file
+        manager.save(result)
+        data = json.loads(manager._cache_path.read_text())  # noqa: SLF001
+        entry = data["stat"][str(p.relative_to(manager._repo_path))]  # noqa: SLF001
+        st = p.stat()
+        assert entry == [st.st_mtime_ns, st.st_size]
 
     def test_save_json_has_result_field(self, manager: CacheManager, result: AnalysisResult) -> None:
         manager.save(result)
@@ -152,6 +162,16 @@ class TestLoadFresh:
         loaded = manager.load()
         assert loaded is None
 
+    def test_load_accepts_schema_version_1_cache(
+        self, manager: CacheManager, result: AnalysisResult
+    ) -> None:
+        """A v1 cache (no stat map) must still load via the hash fallback."""
+        v1_payload = {"schema_version": "1", "result": result.model_dump(mode="json")}
+        manager._cache_path.parent.mkdir(parents=True, exist_ok=True)  # noqa: SLF001
+        manager._cache_path.write_text(json.dumps(v1_payload), encoding="utf-8")  # noqa: SLF001
+        loaded = manager.load()
+        assert loaded is not None
+
     def test_load_preserves_file_count(
         self, manager: CacheManager, result: AnalysisResult
     ) -> None:
@@ -314,3 +314,64 @@ class TestTypeScriptParser:
         # Should extract outer and nested symbols
         assert len(symbols) >= 1
         assert any(s.name == "OuterClass" for s in symbols)
+
+    def test_parse_files_matches_sequential_output(self):
+        """Thread-pool batch parsing matches per-file extract_code_structure."""
+        sources = {
+            "calc.ts": """
+            import { Logger } from './logger';
+
+            export class Calculator {
+                add(a: number, b: number): number { return a + b; }
+                private _reset(): void {}
+            }
+            """,
+            "logger.ts": """
+            export interface Logger {
+                log(message: string): void;
+            }
+
+            export function makeLogger(): Logger {
+                return { log: (message: string) => {} };
+            }
+            """,
+            "types.ts": """
+            export enum Color { Red, Green, Blue }
+            export type Pair = [number, number];
+            """,
+        }
+        files = []
+        for name, code in sources.items():
+            test_file = self.temp_dir / name
+            test_file.write_text(code)
+            files.append((test_file, self.temp_dir))
+
+        sequential = [
+            self.parser.extract_code_structure(path, repo) for path, repo in files
+        ]
+        batch = self.parser.parse_files(files)
+
+        # Symbol/export ids are content-derived and deterministic, so the
+        # tuples should match field-for-field in input order.
+        assert len(batch) == len(sequential)
+        for batch_result, sequential_result in zip(batch, sequential):
+            b_symbols, b_exports, b_func_deps, b_imports, b_metadata = batch_result
+            s_symbols, s_exports, s_func_deps, s_imports, s_metadata = sequential_result
+
+            assert [
+                (s.name, s.symbol_type, s.line_start, s.line_end, s.is_exported)
+                for s in b_symbols
+            ] == [
+                (s.name, s.symbol_type, s.line_start, s.line_end, s.is_exported)
+                for s in s_symbols
+            ]
+            assert [(e.name, e.export_type) for e in b_exports] == [
+                (e.name, e.export_type) for e in s_exports
+            ]
+            assert b_func_deps == s_func_deps
+            assert b_imports == s_imports
+            assert b_metadata == s_metadata
+
+    def test_parse_files_empty_input(self):
+        """Batch parsing of no files returns an empty list without a pool."""
+        assert self.parser.parse_files([]) == []